@@ -10,7 +10,6 @@ from uuid import UUID
 from pydantic import BaseModel
 from fastapi import APIRouter, Body, UploadFile, File
 from fastapi.responses import PlainTextResponse, JSONResponse
-from fastapi.encoders import jsonable_encoder
 from app.config import AppConfig
 from db.db_session import DBSession
 from db.db_model import SyslogModel
@@ -155,7 +154,10 @@ class DBAPI:
             raise e
 
     async def post_syslog(self, syslog_object: list[SyslogModel]):
-        """Post a syslog object to the database."""
+        """Post a syslog object to the database.
+        The objects are buffered and written in the background, "ok" means they were accepted, not stored:
+        they can be lost on a crash or after repeated write failures (see db.write_buffer).
+        """
         try:
             await self.db_session.store_syslog_object(syslog_object)
             return {"status": "ok"}
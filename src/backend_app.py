@@ -1,5 +1,6 @@
 import os
 import uvicorn
+from contextlib import asynccontextmanager
 from typing import Any
 from dotenv import load_dotenv
 from fastapi import FastAPI, APIRouter
@@ -22,12 +23,19 @@ def create_app(config: AppConfig) -> FastAPI:
     if not os.path.exists("logs"):
         os.makedirs("logs")
 
-    # Initialize FastAPI application
-    app = FastAPI()
-
     # Initialize Backend API
     backend_api = BackendAPI(logger, config)
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # one DBSession is shared by every request of the app,
+        # its async client is closed when the app shuts down.
+        async with backend_api.db_api.db_session:
+            yield
+
+    # Initialize FastAPI application
+    app = FastAPI(lifespan=lifespan)
+
     # Include the router in the FastAPI app
     app.include_router(backend_api.api_router)
     
@@ -9,15 +9,24 @@ from pydantic import BaseModel
 from opensearchpy import OpenSearch
 
 
-def install_syslog_template_and_index(client: OpenSearch):
+def install_syslog_template_and_index(client: OpenSearch) -> bool:
     """
     - register dynamic_templates first at Composable Index Template
     - if there are no physical indices, create syslog_index-000000
+    - returns True if the initial index was created
     """
 
+    # refresh less often and let the translog grow before flushing,
+    # writers never wait for a refresh (see DBSession.flush for read-after-write).
     settings = {
         "number_of_shards": 1,
-        "number_of_replicas": 0
+        "number_of_replicas": 0,
+        "refresh_interval": "5s",
+        "translog": {"flush_threshold_size": "1gb"},
+        # raw_data keys become fields, fail loudly at an explicit limit instead of the implicit default.
+        "mapping": {"total_fields": {"limit": 2000}},
+        # raw_data dominates _source, compress stored fields harder (DEFLATE instead of LZ4).
+        "codec": "best_compression",
     }
 
     # dynamic templates
@@ -30,7 +39,8 @@ def install_syslog_template_and_index(client: OpenSearch):
                 "mapping": {"type": "keyword", "ignore_above": 256}
             }
         },
-        # register raw_data_strings as keyword or flattened
+        # register raw_data strings as keyword only (no text + keyword multi-field).
+        # raw_data.* also matches nested paths such as raw_data.Metadata.*
         {
             "raw_data_strings": {
                 "path_match": "raw_data.*",
@@ -38,13 +48,6 @@ def install_syslog_template_and_index(client: OpenSearch):
                 "mapping": {"type": "keyword", "ignore_above": 1024}
             }
         },
-        {
-            "raw_data_strings": {
-                "path_match": "raw_data.Metadata.*",
-                "match_mapping_type": "string",
-                "mapping": {"type": "keyword", "ignore_above": 1024}
-            }
-        },
         # else, treat as text and keyword
         {
             "strings_as_text": {
@@ -75,16 +78,21 @@ def install_syslog_template_and_index(client: OpenSearch):
         }
     }
 
+    # unknown top-level fields are kept in _source but never mapped,
+    # only raw_data (dynamic: True above) is allowed to grow the mapping.
+    mappings = {
+        "dynamic": False,
+        "dynamic_templates": dynamic_templates,
+        "properties": properties
+    }
+
     # install index template & update
     body = {
         "index_patterns": ["syslog_index-*"],
         "priority": 100,
         "template": {
             "settings": settings,
-            "mappings": {
-                "dynamic_templates": dynamic_templates,
-                "properties": properties
-            },
+            "mappings": mappings,
             "aliases": {
                 "syslog_index": {} # alias for the write index
             }
@@ -97,16 +105,17 @@ def install_syslog_template_and_index(client: OpenSearch):
 
     # Check if the index exists, if not create it
     exists = client.indices.exists_alias(name="syslog_index")
-    if not exists:
-        print("Creating initial index syslog_index-000001")
-        client.indices.create(
-            index="syslog_index-000001",
-            body={
-                "settings": settings,
-                "mappings": {"dynamic_templates": dynamic_templates, "properties": properties},
-                "aliases": {"syslog_index": {"is_write_index": True}}
-            }
-        )
+    if exists:
+        return False
+    client.indices.create(
+        index="syslog_index-000001",
+        body={
+            "settings": settings,
+            "mappings": mappings,
+            "aliases": {"syslog_index": {"is_write_index": True}}
+        }
+    )
+    return True
 
 class SyslogModel(BaseModel):
     """SyslogModel is a Pydantic model for syslog entries interface."""
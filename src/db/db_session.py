@@ -6,11 +6,19 @@ https://forum.opensearch.org/t/about-python-client-library-and-elasticsearch-dsl
 to support OpenSearch, you need to use the `elasticsearch` library 7.13 or earlier.
 """
 
-from typing import Any
+import asyncio
+import heapq
+import time
+import orjson
+from collections import deque
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
-from opensearchpy import OpenSearch
-from opensearchpy.helpers import streaming_bulk
+from opensearchpy import OpenSearch, AsyncOpenSearch, AsyncHttpConnection
+from opensearchpy.helpers import async_bulk
 from db.db_model import SyslogModel, SyslogSequence, install_syslog_template_and_index
+from db.serializer import OrjsonSerializer
+from db.write_buffer import BufferedSyslog, SyslogWriteBuffer
 from db.exceptions import DatabaseInteractionException
 
 
@@ -20,20 +28,100 @@ class DBSession:
     """
     __logger: Any
     __index_name: str
-    __client: OpenSearch
+    __client: Optional[AsyncOpenSearch]
+
+    __thread_count: int
+    __chunk_size: int
+    __max_chunk_bytes: int
+    __write_buffer: SyslogWriteBuffer
+
+    __PIT_KEEP_ALIVE: str = "1m"
+    ## static fragments shared by every search body. they are never mutated.
+    __TIMESTAMP_SORT: list[dict] = [
+        {"timestamp": {"order": "asc"}},
+        {"_id": {"order": "asc"}}  # tie-breaker for consistent pagination
+    ]
+    __RAW_DATA_SOURCE: list[str] = ["raw_data"]
+    ## strip the response envelope (shards, _index, _score, ...) of the raw_data page searches
+    __RAW_DATA_FILTER_PATH: list[str] = ["pit_id", "hits.hits._source.raw_data", "hits.hits.sort"]
+    ## maximum number of searches in flight for a single call
+    __SEARCH_CONCURRENCY: int = 16
+    ## number of trace queries bundled into a single msearch request
+    __MSEARCH_BATCH_SIZE: int = 64
+    ## bool occurrence keys. the query DSL is case-sensitive, so no lowercasing is needed
+    __CLAUSE_KEYS: frozenset[str] = frozenset(("must", "should", "must_not", "filter"))
+    ## bounds and latency targets of the adaptive bulk chunk size
+    __MIN_CHUNK_SIZE: int = 250
+    __MAX_CHUNK_SIZE: int = 10000
+    __BULK_FAST_SECONDS: float = 0.5
+    __BULK_SLOW_SECONDS: float = 2.0
+
+    def __init__(self,
+                 loger: Any,
+                 uri: str,
+                 index_name: str,
+                 # connection config
+                 pool_maxsize: int = 32,
+                 # bulk config
+                 thread_count: int = 8,
+                 chunk_size: int = 2000,
+                 max_chunk_bytes: int = 10 * 1024 * 1024,
+                 # write-behind buffer config
+                 buffer_capacity: int = 100_000,
+                 flush_interval_ms: int = 100):
+        """_summary_
+        Initializes the DBSession with an OpenSearch connection.
 
-    def __init__(self, loger: Any, uri: str, index_name: str):
+        Args:
+            loger (Any): Logger instance for logging.
+            uri (str): Host of the OpenSearch cluster.
+            index_name (str): Name of the index (or alias) to store syslogs in.
+            pool_maxsize (int): Number of keep-alive connections pooled by the client.
+                It is raised to at least thread_count so concurrent bulk requests never wait for a connection.
+            thread_count (int): Number of bulk requests sent concurrently.
+                Bulk indexing is network-bound, so this does not depend on the CPU count.
+            chunk_size (int): Initial number of documents per bulk request.
+                It adapts to bulk latency and 429 rejections at runtime.
+            max_chunk_bytes (int): Maximum size of a single bulk request in bytes.
+            buffer_capacity (int): Maximum number of SyslogObjects waiting in the write-behind buffer.
+            flush_interval_ms (int): Maximum time in milliseconds a SyslogObject waits in the buffer.
+                This is also the window of SyslogObjects lost on a crash.
+        """
         self.__index_name = index_name
         self.__logger = loger
+        self.__thread_count = thread_count
+        self.__chunk_size = chunk_size
+        self.__max_chunk_bytes = max_chunk_bytes
+        self.__write_buffer = SyslogWriteBuffer(
+            loger,
+            flush_func=self.__bulk_store,
+            capacity=buffer_capacity,
+            chunk_size=chunk_size,
+            flush_interval_ms=flush_interval_ms
+        )
         self.__logger.info(f"Connecting to OpenSearch at {uri}")
         try:
-            self.__client = OpenSearch(
+            ## NOTICE: this client is shared by every request handled by this session.
+            ## do not create per-call clients; the connection pool below is sized for
+            ## the concurrent bulk requests and searches of this single instance.
+            ## the async client never blocks the event loop; close it with `await close()`.
+            ## the aiohttp connection keeps pooled connections alive and disables Nagle (TCP_NODELAY)
+            ## by default. http_compress gzips request bodies and asks for gzip responses.
+            serializer = OrjsonSerializer()
+            self.__client = AsyncOpenSearch(
                 hosts=[{"host": uri, "port": 9200}],
-                http_compress=False,
+                connection_class=AsyncHttpConnection,
+                http_compress=True,
                 use_ssl=False,
                 timeout=60,
                 max_retries=3,
                 retry_on_timeout=True,
+                ## aiohttp connection pool size (pool_maxsize of the sync client)
+                maxsize=max(pool_maxsize, thread_count),
+                ## no sniffing: the single node publishes its container address,
+                ## which is not reachable from outside the compose network.
+                serializer=serializer,
+                serializers=serializer.registry(),
             )
         except ConnectionError as e:
             self.__logger.error(f"Failed to connect to OpenSearch at {uri}. Please check your connection settings.")
@@ -43,7 +131,17 @@ class DBSession:
             ) from e
         try:
             # document initialization
-            install_syslog_template_and_index(self.__client)
+            ## __init__ cannot await, so the template is installed with a short-lived sync client.
+            init_client = OpenSearch(
+                hosts=[{"host": uri, "port": 9200}],
+                use_ssl=False,
+                timeout=60,
+            )
+            try:
+                if install_syslog_template_and_index(init_client):
+                    self.__logger.info("Created initial index syslog_index-000001")
+            finally:
+                init_client.close()
         except Exception as e:
             self.__logger.error(f"Failed to initialize SyslogDocument: {e}")
             raise DatabaseInteractionException(
@@ -51,54 +149,211 @@ class DBSession:
                 (self.__index_name,)
             ) from e
 
-    def __del__(self):
+    async def close(self):
         """_summary_
-        Destructor to close the connection to OpenSearch.
+        Close the connection to OpenSearch.
+        Must be awaited on application shutdown, or use the session with `async with`.
+        Buffered SyslogObjects are written before the client is closed.
         """
+        await self.__write_buffer.close()
         if self.__client:
-            self.__client.transport.close()
+            await self.__client.close()
             self.__client = None
             self.__logger.info("Closed connection to OpenSearch.")
 
-    def __actions(self, docs:list[SyslogModel]):
-        for d in docs:
-            yield {"_op_type":"index","_index":self.__index_name,"_source":d.model_dump()}
+    async def __aenter__(self) -> "DBSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __actions(self, docs: list[BufferedSyslog]) -> list[dict]:
+        ## SyslogModel only holds flat values (UUID, str, datetime, dict), so its field dict is
+        ## the bulk source as-is: no model_dump traversal, and UUID/datetime are encoded natively
+        ## by OrjsonSerializer. op_type defaults to "index" and the index is given once to the
+        ## bulk request instead of per action. the buffer id is the document _id, so a retried
+        ## document overwrites itself.
+        ## a list comprehension avoids resuming a generator frame per document.
+        return [{"_id": doc_id, "_source": d.__dict__} for doc_id, d in docs]
 
-    def __count_clauses(self, query: dict|list)->int:
+    def __flatten_bool(self, node: Any) -> Any:
         """_summary_
-        Count the number of clauses in an input query represented as a dictionary.
+        Return a copy of the query with redundant bool nesting removed.
+        A nested bool that only holds the same occurrence as its parent (must in must,
+        filter in filter, should in should) is spliced into the parent, identical clauses
+        of an occurrence are deduplicated, and match_all is dropped from must/filter lists
+        that hold other clauses. Mixed or must_not nesting is kept as-is, and so are
+        the should clauses of a bool with minimum_should_match, since splicing or
+        deduplicating them would change the count minimum_should_match applies to.
+        """
+        if isinstance(node, list):
+            return [self.__flatten_bool(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        ## flatten bottom-up, so a single level of splicing is enough below
+        out: dict = {key: self.__flatten_bool(value) for key, value in node.items()}
+        bool_query = out.get("bool")
+        if not isinstance(bool_query, dict):
+            return out
+        ## splicing or deduplicating should clauses would change what minimum_should_match counts
+        counted: bool = "minimum_should_match" in bool_query
+        for occur in ("must", "filter", "should", "must_not"):
+            clauses = bool_query.get(occur)
+            if clauses is None or (counted and occur == "should"):
+                continue
+            if not isinstance(clauses, list):
+                clauses = [clauses]
+            flat: list = []
+            seen: set[bytes] = set()
+            for clause in clauses:
+                nested = clause.get("bool") if isinstance(clause, dict) and len(clause) == 1 else None
+                if occur != "must_not" and isinstance(nested, dict) and nested.keys() == {occur}:
+                    items = nested[occur] if isinstance(nested[occur], list) else [nested[occur]]
+                else:
+                    items = [clause]
+                for item in items:
+                    key = orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+                    if key not in seen:
+                        seen.add(key)
+                        flat.append(item)
+            if occur in ("must", "filter") and len(flat) > 1:
+                flat = [clause for clause in flat if clause != {"match_all": {}}]
+            bool_query[occur] = flat
+        return out
+
+    def __extract_clauses(self, query: dict|list) -> list[dict]:
+        """_summary_
+        Extract every bool clause (must, should, must_not, filter) of an input query in one pass.
+        The walk is iterative and visits the query in the same depth-first order as a recursive walk.
         """
-        clause_count = 0
-        def count_recursive(element):
-            nonlocal clause_count
-            if isinstance(element, dict):
-                for key, value in element.items():
-                    if key.lower() in ('must', 'should', 'must_not', 'filter'):
-                        clause_count += len(value) if isinstance(value, list) else 1
-                    count_recursive(value)
-            elif isinstance(element, list):
-                for item in element:
-                    count_recursive(item)
-        count_recursive(query)
-        return clause_count
-
-    def __split_query(self, query: dict|list, max_clauses: int)->list[dict]:
-        """Split the input query into multiple smaller queries if it exceeds the max_clauses."""
         clauses: list[dict] = []
-        def extract_clauses(element):
-            if isinstance(element, dict):
-                for key, value in element.items():
-                    if key.lower() in ('must', 'should', 'must_not', 'filter'):
-                        if isinstance(value, list):
-                            clauses.extend(value)
-                        else:
-                            clauses.append(value)
-                    extract_clauses(value)
-            elif isinstance(element, list):
-                for item in element:
-                    extract_clauses(item)
-        # Extract all clauses from the original query
-        extract_clauses(query)
+        clause_keys: frozenset[str] = self.__CLAUSE_KEYS
+        ## stack of (key, value) pairs, key is None for list items and the root
+        stack: deque = deque([(None, query)])
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            key, element = pop()
+            ## exact type checks: parsed JSON only holds plain dicts and lists
+            element_type = type(element)
+            if key in clause_keys:
+                if element_type is list:
+                    clauses.extend(element)
+                else:
+                    clauses.append(element)
+            if element_type is dict:
+                extend(reversed(element.items()))
+            elif element_type is list:
+                extend((None, item) for item in reversed(element))
+        return clauses
+
+    async def __open_pit(self) -> str:
+        """_summary_
+        Open a Point-In-Time on the syslog index so that every page of a search
+        is served from the same frozen shard state.
+        """
+        resp = await self.__client.create_point_in_time(
+            index=self.__index_name,
+            keep_alive=self.__PIT_KEEP_ALIVE
+        )
+        return resp["pit_id"]
+
+    async def __close_pit(self, pit_id: str):
+        """_summary_
+        Release a Point-In-Time opened by __open_pit.
+        A failure is only logged because the PIT expires after its keep_alive anyway.
+        """
+        try:
+            await self.__client.delete_point_in_time(body={"pit_id": [pit_id]})
+        except Exception as e:
+            self.__logger.warning(f"Failed to delete point in time: {e}")
+
+    async def __scan(self,
+                     body: dict,
+                     filter_path: Optional[list[str]] = None,
+                     pit: Optional[dict] = None) -> AsyncIterator[dict]:
+        """_summary_
+        Yield every hit of a sorted search, paging with search_after on a Point-In-Time.
+        This is the PIT counterpart of opensearchpy.helpers.scan: the sort of the body is
+        preserved, and the body must end its sort with a tie-breaker.
+
+        Args:
+            body (dict): The search body. It is not modified.
+            filter_path (Optional[list[str]]): Response filter, it must keep pit_id and hits.hits.sort.
+            pit (Optional[dict]): A PIT ({"id": ..., "keep_alive": ...}) shared by several scans.
+                The caller opens and closes it, its id is updated in place when the server renews it.
+                When None, a PIT is opened and closed for this scan only.
+
+        Yields:
+            dict: The hits in sort order.
+        """
+        owned: bool = pit is None
+        if pit is None:
+            pit = {"id": await self.__open_pit(), "keep_alive": self.__PIT_KEEP_ALIVE}
+        ## copy once, then only the search_after key is updated in place per page
+        page = dict(body)  # shallow copy
+        page.pop("search_after", None)
+        page["pit"] = pit
+        page_size: int = page.get("size", 10)
+        try:
+            while True:
+                ## the index is bound to the PIT, so it must not be passed to search
+                resp = await self.__client.search(body=page, filter_path=filter_path)
+                pit["id"] = resp.get("pit_id", pit["id"])
+                hits = resp.get("hits", {}).get("hits", [])
+                for h in hits:
+                    yield h
+                ## a short page is the last one, no need for an empty round trip
+                if len(hits) < page_size:
+                    break
+                ## get next page token
+                page["search_after"] = hits[-1].get("sort")
+        finally:
+            if owned:
+                await self.__close_pit(pit["id"])
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def __unit_filter(unit_id: UUID) -> dict:
+        """_summary_
+        Build the term clause that selects the SyslogObjects of a unit.
+        The clause is cached and shared between queries, it must not be modified.
+        """
+        return {"term": {"unit_id": str(unit_id)}}
+
+    def __trace_query(self, unit_id: UUID, trace_id: str) -> dict:
+        """_summary_
+        Build the query body that retrieves the SyslogObjects of a single trace in timestamp order.
+        """
+        return {
+            "size": 1000,
+            ## only the hits are used, counting all of them is wasted work
+            "track_total_hits": False,
+            ## only raw_data is consumed by the callers
+            "_source": self.__RAW_DATA_SOURCE,
+            ## exact matches only, filter context skips scoring (hits are sorted by timestamp)
+            "query": {
+                "bool": {
+                    "filter": [
+                        self.__unit_filter(unit_id),
+                        {"term": {"trace_id": trace_id}}
+                    ]
+                }
+            },
+            "sort": self.__TIMESTAMP_SORT
+        }
+
+    def __process_query(self, query: dict|list, max_clauses: int=1024)->list[dict]:
+        """_summary_
+        Split the input query into multiple smaller queries if it exceeds the max_clauses.
+        """
+        query = self.__flatten_bool(query)
+        clauses: list[dict] = self.__extract_clauses(query)
+        if len(clauses) < max_clauses:
+            # Process the query here as needed
+            if isinstance(query, dict):
+                return [query]
+            return query
         # Split clauses into smaller chunks
         split_queries: list[dict] = []
         for i in range(0, len(clauses), max_clauses):
@@ -112,21 +367,14 @@ class DBSession:
             })
         return split_queries
 
-    def __process_query(self, query: dict|list, max_clauses: int=1024)->list[dict]:
-        clause_count = self.__count_clauses(query)
-        if clause_count >= max_clauses:
-            split_queries = self.__split_query(query=query, max_clauses=max_clauses)
-            return split_queries
-        else:
-            # Process the query here as needed
-            if isinstance(query, dict):
-                return [query]
-            return query
-
 
     async def store_syslog_object(self, syslog_bulk: list[SyslogModel]):
         """_summary_
         Save a SyslogObject to OpenSearch.
+        The SyslogObjects are queued in the write-behind buffer and written in batches,
+        use `flush()` when they must be stored before returning.
+        Returning does not mean they are stored: they are lost on a crash before the next drain,
+        or dropped after the buffer retried a failing batch (see db.write_buffer).
 
         Args:
             syslog_object (SyslogModel): The SyslogObject to save.
@@ -135,22 +383,132 @@ class DBSession:
             DatabaseInteractionException: If there is an error during the save operation.
         """
         try:
-            for ok, info in streaming_bulk(
-                client=self.__client,
-                actions=self.__actions(syslog_bulk),
-                chunk_size=500,
-                max_retries=3,
-                raise_on_error=False,
-                request_timeout=60
-            ):
-                pass
+            await self.__write_buffer.append(syslog_bulk)
         except Exception as e:
             self.__logger.error(f"Failed to save SyslogObject: {e}")
             raise DatabaseInteractionException(
                 f"Failed to save SyslogObject: {e}",
                 (str(),)
             ) from e
-        
+
+    async def __bulk_store(self, syslog_bulk: list[BufferedSyslog]) -> list[BufferedSyslog]:
+        """_summary_
+        Write a batch of (document id, SyslogObject) pairs with concurrent bulk requests.
+        Called by the write-behind buffer. Every document is indexed under its buffer id,
+        so writing it again overwrites it instead of adding a duplicate.
+
+        Returns:
+            list[BufferedSyslog]: The pairs that were not written and may be retried: every pair of
+                a partition whose request raised, and the documents rejected with 429 or a 5xx status.
+                Documents rejected for another reason (e.g. a mapping error) would fail again, they are only logged.
+
+        Raises:
+            DatabaseInteractionException: If there is an error while preparing the bulk requests.
+        """
+        try:
+            chunk_size: int = self.__chunk_size
+            ## send up to thread_count bulk requests concurrently on the event loop
+            semaphore = asyncio.Semaphore(self.__thread_count)
+            parts: list[list[BufferedSyslog]] = [
+                syslog_bulk[i:i + chunk_size] for i in range(0, len(syslog_bulk), chunk_size)
+            ]
+
+            async def send(part: list[BufferedSyslog]) -> tuple[int, list]:
+                async with semaphore:
+                    return await async_bulk(
+                        client=self.__client,
+                        actions=self.__actions(part),
+                        index=self.__index_name,
+                        chunk_size=chunk_size,
+                        max_chunk_bytes=self.__max_chunk_bytes,
+                        raise_on_error=False,
+                        ## documents rejected with 429 are retried by the helper with backoff
+                        max_retries=3,
+                        initial_backoff=1,
+                        request_timeout=60
+                    )
+
+            started: float = time.perf_counter()
+            ## a failing partition does not abort the others, only its own documents are returned for a retry
+            results = await asyncio.gather(*(send(part) for part in parts), return_exceptions=True)
+            elapsed: float = time.perf_counter() - started
+        except Exception as e:
+            self.__logger.error(f"Failed to save SyslogObject: {e}")
+            raise DatabaseInteractionException(
+                f"Failed to save SyslogObject: {e}",
+                (str(),)
+            ) from e
+
+        failed: list[BufferedSyslog] = []
+        retry_ids: set[str] = set()
+        rejected: bool = False
+        for part, result in zip(parts, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                ## some chunks of the partition may be indexed already, their ids make the retry overwrite them
+                self.__logger.error(f"Failed to index {len(part)} SyslogObjects: {result}")
+                rejected = rejected or getattr(result, "status_code", None) == 429
+                failed.extend(part)
+                continue
+            for info in result[1]:
+                self.__logger.error(f"Failed to index SyslogObject: {info}")
+                for item in info.values():
+                    if not isinstance(item, dict):
+                        continue
+                    status = item.get("status")
+                    rejected = rejected or status == 429
+                    if isinstance(status, int) and (status == 429 or status >= 500):
+                        retry_ids.add(item.get("_id"))
+        if retry_ids:
+            failed.extend(pair for pair in syslog_bulk if pair[0] in retry_ids)
+        ## requests run in rounds of thread_count
+        rounds: int = -(-len(parts) // self.__thread_count)
+        self.__adapt_chunk_size(len(syslog_bulk), elapsed, rounds, rejected=rejected)
+        return failed
+
+    def __adapt_chunk_size(self, doc_count: int, elapsed: float, rounds: int, rejected: bool):
+        """_summary_
+        Adapt the number of documents per bulk request to the cluster feedback.
+        The chunk size is halved when the cluster rejected documents (429) or a request was slow,
+        and doubled when full requests were fast. max_chunk_bytes still bounds every request.
+
+        Args:
+            doc_count (int): Number of SyslogObjects in the batch.
+            elapsed (float): Wall time of the batch in seconds.
+            rounds (int): Number of sequential rounds of concurrent bulk requests in the batch.
+            rejected (bool): Whether the cluster rejected documents with 429.
+        """
+        latency: float = elapsed / max(rounds, 1)
+        if rejected or latency > self.__BULK_SLOW_SECONDS:
+            chunk_size = max(self.__MIN_CHUNK_SIZE, self.__chunk_size // 2)
+        elif doc_count >= self.__chunk_size and latency < self.__BULK_FAST_SECONDS:
+            chunk_size = min(self.__MAX_CHUNK_SIZE, self.__chunk_size * 2)
+        else:
+            return
+        if chunk_size != self.__chunk_size:
+            self.__logger.info(f"Bulk chunk size {self.__chunk_size} -> {chunk_size} "
+                               f"(latency={latency:.3f}s, rejected={rejected})")
+            self.__chunk_size = chunk_size
+
+    async def flush(self):
+        """_summary_
+        Write the buffered SyslogObjects and refresh the syslog index
+        so that previously stored SyslogObjects become searchable.
+        Writes do not wait for a refresh, use this when read-after-write is required.
+
+        Raises:
+            DatabaseInteractionException: If there is an error during the refresh operation.
+        """
+        try:
+            await self.__write_buffer.flush()
+            await self.__client.indices.refresh(index=self.__index_name)
+        except Exception as e:
+            self.__logger.error(f"Failed to refresh index {self.__index_name}: {e}")
+            raise DatabaseInteractionException(
+                f"Failed to refresh index {self.__index_name}: {e}",
+                (self.__index_name,)
+            ) from e
 
     async def get_syslog_sequence_with_trace(self, unit_id: UUID, trace_id: str, label: str = "") -> SyslogSequence:
         """_summary_
@@ -167,58 +525,20 @@ class DBSession:
             DatabaseInteractionException: If there is an error during the retrieval operation.
         """
         try:
-            query:dict = {
-                "size": 100,
-                "track_total_hits": True,
-                "query": {
-                    "bool": {
-                        "must": [
-                            {"term": {"unit_id": f"{unit_id}"}},
-                            {"term": {"trace_id": f"{trace_id}"}}
-                        ]
-                    }
-                },
-                "sort": [
-                    {"timestamp": {"order": "asc"}},
-                    {"_id": {"order": "asc"}}  # tie-breaker for consistent pagination
-                ]
-            }
-            syslog_sequence: list[dict] = []
-            search_after = None
-
-            while True:
-                my_query = dict(query)  # shallow copy
-                if search_after is not None:
-                    my_query["search_after"] = search_after
-                resp = self.__client.search(
-                    index=self.__index_name,
-                    body=my_query
-                    )
-                hits = resp.get("hits", {}).get("hits", [])
-                if not hits:
-                    break
-                # collect all raw_data
-                for h in hits:
-                    src = h.get("_source", {})
-                    raw = src.get("raw_data")
-                    if raw is not None:
-                        syslog_sequence.append(raw)
-
-                ## get next page token
-                search_after = hits[-1].get("sort")
-
-            ## align the syslog sequence based on timestamp
-            aligned_sequence: list[dict] = sorted(
-                syslog_sequence,
-                key=lambda x: x.get("Timestamp", "")
-            )
-
+            query: dict = self.__trace_query(unit_id=unit_id, trace_id=trace_id)
+            # collect all raw_data
+            syslog_sequence: list[dict] = [
+                raw async for h in self.__scan(query, filter_path=self.__RAW_DATA_FILTER_PATH)
+                if (raw := h.get("_source", {}).get("raw_data")) is not None
+            ]
+
+            ## hits are already sorted by timestamp on the server side
             syslog_sequence_model = SyslogSequence(
                 label=label,
-                syslogs=aligned_sequence
+                syslogs=syslog_sequence
             )
 
-            self.__logger.info(f"Retrieved {len(aligned_sequence)} SyslogObjects for unit_id={unit_id} and trace_id={trace_id}")
+            self.__logger.info(f"Retrieved {len(syslog_sequence)} SyslogObjects for unit_id={unit_id} and trace_id={trace_id}")
 
             return syslog_sequence_model
 
@@ -254,86 +574,80 @@ class DBSession:
         try:
             query_template:dict = {
                 "size": 100,
-                "track_total_hits": True,
+                "track_total_hits": False,
+                ## only raw_data is consumed
+                "_source": self.__RAW_DATA_SOURCE,
+                ## filter context skips scoring, hits are sorted by timestamp anyway
                 "query": {
                     "bool": {
-                        "must": [
-                            {"term": {"unit_id": f"{unit_id}"}},
-                            {"term": {"raw_data.EventName": f"{category}"}},
+                        "filter": [
+                            self.__unit_filter(unit_id),
+                            {"term": {"raw_data.EventName": category}},
                         ]
                     }
                 },
-                "sort": [
-                    {"timestamp": {"order": "asc"}},
-                    {"_id": {"order": "asc"}}  # tie-breaker for consistent pagination
-                ],
+                "sort": self.__TIMESTAMP_SORT,
             }
-            syslog_sequence: list[dict] = []
-            search_after = None
+            ## one run of (sort value, raw_data) per subquery, each already sorted by the server
+            runs: list[list[tuple[list, dict]]] = []
 
             # split query
             processed_query = self.__process_query(query=query, max_clauses=1024)
 
-            for q in processed_query:
-                while True:
-                    my_query = dict(query_template)  # shallow copy
-                    
-                    ## check validity of my_query and q
-                    if my_query.get("query") is None or my_query["query"].get("bool") is None:
-                        raise ValueError("Invalid query template structure")
-                    if not isinstance(my_query["query"]["bool"], dict):
-                        raise ValueError("Invalid query template structure: 'bool' should be a dictionary")
+            ## one PIT is shared by every subquery, so all of them read the same snapshot
+            pit: dict = {"id": await self.__open_pit(), "keep_alive": self.__PIT_KEEP_ALIVE}
+            try:
+                for q in processed_query:
+                    ## check validity of q
                     if q.get("query") is None or q["query"].get("bool") is None:
                         raise ValueError("Invalid subquery structure")
                     if not isinstance(q["query"]["bool"], dict):
                         raise ValueError("Invalid subquery structure: 'bool' should be a dictionary")
-                    
-                    # merge q into my_query
-                    ## merge the must clauses with existing must clauses
-                    my_query["query"]["bool"]["must"].extend(q["query"]["bool"].get("must", []))
+
+                    # merge q into a fresh copy of the template, once per subquery
+                    bool_query: dict = {
+                        key: list(values) if isinstance(values, list) else values
+                        for key, values in query_template["query"]["bool"].items()
+                    }
+                    ## must and filter clauses match the same documents, move them to filter context
+                    for key in ("must", "filter"):
+                        values = q["query"]["bool"].get(key, [])
+                        bool_query["filter"].extend(values if isinstance(values, list) else [values])
                     ## append other clauses
                     for key, values in q["query"]["bool"].items():
-                        if key not in ("must",):
-                            if key not in my_query["query"]["bool"]:
-                                my_query["query"]["bool"][key] = values
+                        if key not in ("must", "filter"):
+                            if key not in bool_query:
+                                bool_query[key] = values
                             else:
                                 if isinstance(values, list):
-                                    my_query["query"]["bool"][key].extend(values)
+                                    bool_query[key].extend(values)
                                 else:
-                                    # if it's not a list, convert to list and append
-                                    my_query["query"]["bool"][key] = [values]
-                                    my_query["query"]["bool"][key].extend(values)
-                    if search_after is not None:
-                        my_query["search_after"] = search_after
-                    resp = self.__client.search(
-                        index=self.__index_name,
-                        body=my_query
-                        )
-                    hits = resp.get("hits", {}).get("hits", [])
-                    if not hits:
-                        break
+                                    bool_query[key].append(values)
+                    my_query: dict = dict(query_template)  # shallow copy
+                    my_query["query"] = {"bool": bool_query}
+
+                    ## every subquery pages from the beginning of the shared PIT
+                    run: list[tuple[list, dict]] = []
+                    runs.append(run)
                     # collect all raw_data
-                    for h in hits:
-                        src = h.get("_source", {})
-                        raw = src.get("raw_data")
+                    async for h in self.__scan(my_query, filter_path=self.__RAW_DATA_FILTER_PATH, pit=pit):
+                        raw = h.get("_source", {}).get("raw_data")
                         if raw is not None:
-                            syslog_sequence.append(raw)
-
-                    ## get next page token
-                    search_after = hits[-1].get("sort")
+                            run.append((h.get("sort"), raw))
+            finally:
+                await self.__close_pit(pit["id"])
 
-            ## align the syslog sequence based on timestamp
-            aligned_sequence: list[dict] = sorted(
-                syslog_sequence,
-                key=lambda x: x.get("Timestamp", "")
-            )
+            ## the runs are sorted by (timestamp, _id) on the server side, merge them instead of re-sorting
+            syslog_sequence: list[dict] = [
+                raw for _, raw in heapq.merge(*runs, key=lambda x: x[0])
+            ]
 
             syslog_sequence_model = SyslogSequence(
                 label="",
-                syslogs=aligned_sequence
+                syslogs=syslog_sequence
             )
 
-            self.__logger.info(f"Retrieved {len(aligned_sequence)} SyslogObjects for unit_id={unit_id}, with subqueries {query}.")
+            self.__logger.info(f"Retrieved {len(syslog_sequence)} SyslogObjects for unit_id={unit_id}, with subqueries {query}.")
 
             return syslog_sequence_model
 
@@ -359,46 +673,52 @@ class DBSession:
             DatabaseInteractionException: If there is an error during the retrieval operation.
         """
         try:
+            ## no hits are needed: a composite aggregation returns every trace_id exactly once,
+            ## paginated by after_key, with the first timestamp of each trace.
             query: dict = {
-                "size": 100,
-                "track_total_hits": True,
-                "_source": ["trace_id"],
+                "size": 0,
+                "track_total_hits": False,
                 "query": {
                     "bool": {
-                        "must": [
-                            {"term": {"unit_id": f"{unit_id}"}},
+                        "filter": [
+                            self.__unit_filter(unit_id),
                             lucene_query
                         ]
                     }
                 },
-                "sort": [
-                    {"timestamp": {"order": "asc"}},
-                    {"_id": {"order": "asc"}}  # tie-breaker for consistent pagination
-                ]
+                "aggs": {
+                    "trace_ids": {
+                        "composite": {
+                            "size": 1000,
+                            "sources": [{"trace_id": {"terms": {"field": "trace_id"}}}]
+                        },
+                        "aggs": {
+                            "first_seen": {"min": {"field": "timestamp"}}
+                        }
+                    }
+                }
             }
-            ## get all the trace_ids first
-            trace_ids: list[str] = []
-            search_after = None
+            composite: dict = query["aggs"]["trace_ids"]["composite"]
+            first_seen: list[tuple[float, str]] = []
             while True:
-                my_query = dict(query)  # shallow copy
-                if search_after is not None:
-                    my_query["search_after"] = search_after
-                resp = self.__client.search(
+                resp = await self.__client.search(
                     index=self.__index_name,
-                    body=my_query
+                    body=query
                     )
-                hits = resp.get("hits", {}).get("hits", [])
-                if not hits:
+                agg = resp.get("aggregations", {}).get("trace_ids", {})
+                buckets = agg.get("buckets", [])
+                for b in buckets:
+                    first_seen.append((b["first_seen"]["value"], b["key"]["trace_id"]))
+                ## a short page is the last one, no need for an empty round trip
+                after_key = agg.get("after_key")
+                if len(buckets) < composite["size"] or after_key is None:
                     break
-                # collect all trace_ids
-                for h in hits:
-                    src = h.get("_source", {})
-                    trace_id = src.get("trace_id")
-                    if trace_id and trace_id not in trace_ids:
-                        trace_ids.append(trace_id)
-
                 ## get next page token
-                search_after = hits[-1].get("sort")
+                composite["after"] = after_key
+
+            ## composite buckets are ordered by trace_id, restore the first-seen (timestamp) order
+            first_seen.sort()
+            trace_ids: list[str] = [trace_id for _, trace_id in first_seen]
 
             self.__logger.info(f"Found {len(trace_ids)} unique trace_ids for unit_id={unit_id} with the given Lucene query.")
 
@@ -428,15 +748,10 @@ class DBSession:
             ## first get all the trace_ids matching the lucene query
             trace_ids: list[str] = await self.get_trace_ids_with_lucene_query(unit_id=unit_id,
                                                                             lucene_query=lucene_query)
-            ## then get the sequences for each trace_id
-            result: list[SyslogSequence] = []
-            for sequence in trace_ids:
-                syslog_sequence: SyslogSequence = await self.get_syslog_sequence_with_trace(unit_id=unit_id,
-                                                                                            trace_id=sequence,
-                                                                                            label=input_label)
-                if syslog_sequence:
-                    result.append(syslog_sequence)
-            return result
+            ## then get the sequences for each trace_id in batched round trips
+            return await self.__msearch_syslog_sequences(unit_id=unit_id,
+                                                         trace_ids=trace_ids,
+                                                         label=input_label)
 
         except Exception as e:
             self.__logger.error(f"Failed to retrieve SyslogSequences: {e}")
@@ -445,9 +760,81 @@ class DBSession:
                 (str(lucene_query),)
             ) from e
 
+    async def __msearch_syslog_sequences(self,
+                                         unit_id: UUID,
+                                         trace_ids: list[str],
+                                         label: str,
+                                         batch_size: int = __MSEARCH_BATCH_SIZE) -> list[SyslogSequence]:
+        """_summary_
+        Retrieve the SyslogSequences of several traces with one msearch request per batch.
+        A trace that fills the whole first page may have more hits,
+        so it falls back to the paginated get_syslog_sequence_with_trace.
+
+        Args:
+            unit_id (UUID): The unit ID to filter by.
+            trace_ids (list[str]): The trace IDs to retrieve.
+            label (str): The label attached to every returned SyslogSequence.
+            batch_size (int): The number of trace queries bundled into a single msearch request.
+
+        Returns:
+            list[SyslogSequence]: The SyslogSequences in the order of trace_ids.
+        """
+        ## batches and paginated fallbacks run concurrently, bounded by one semaphore
+        semaphore = asyncio.Semaphore(self.__SEARCH_CONCURRENCY)
+
+        async def fetch_trace(trace_id: str) -> SyslogSequence:
+            async with semaphore:
+                return await self.get_syslog_sequence_with_trace(unit_id=unit_id,
+                                                                 trace_id=trace_id,
+                                                                 label=label)
+
+        async def fetch_batch(batch: list[str]) -> list[SyslogSequence]:
+            ## msearch body is a list of (header, query) pairs
+            body: list[dict] = []
+            for trace_id in batch:
+                body.append({})
+                body.append(self.__trace_query(unit_id=unit_id, trace_id=trace_id))
+            async with semaphore:
+                resp = await self.__client.msearch(index=self.__index_name, body=body)
+            sequences: list[SyslogSequence | None] = []
+            fallbacks: dict[int, str] = {}
+            ## responses preserve the order of the queries
+            for trace_id, sub_query, sub_resp in zip(batch, body[1::2], resp.get("responses", [])):
+                if "error" in sub_resp:
+                    raise DatabaseInteractionException(
+                        f"msearch failed for trace_id={trace_id}: {sub_resp['error']}",
+                        (str(unit_id), trace_id)
+                    )
+                hits = sub_resp.get("hits", {}).get("hits", [])
+                if len(hits) >= sub_query["size"]:
+                    ## the trace does not fit in one page, page through it
+                    fallbacks[len(sequences)] = trace_id
+                    sequences.append(None)
+                    continue
+                syslog_sequence: list[dict] = []
+                for h in hits:
+                    raw = h.get("_source", {}).get("raw_data")
+                    if raw is not None:
+                        syslog_sequence.append(raw)
+                ## hits are already sorted by timestamp on the server side
+                sequences.append(SyslogSequence(label=label, syslogs=syslog_sequence))
+            paged = await asyncio.gather(*(fetch_trace(t) for t in fallbacks.values()))
+            for idx, sequence in zip(fallbacks.keys(), paged):
+                sequences[idx] = sequence
+            return sequences
+
+        batches = await asyncio.gather(*(
+            fetch_batch(trace_ids[i:i + batch_size])
+            for i in range(0, len(trace_ids), batch_size)
+        ))
+        ## gather preserves the order of the batches, so the result follows trace_ids
+        return [sequence for batch in batches for sequence in batch]
+
     async def flush_unit_syslogs(self, unit_id: UUID)->int:
         """_summary_
         Delete SyslogObjects associated with a specific unit_id.
+        The write-behind buffer is flushed first, so that SyslogObjects of the unit still
+        waiting in it are not indexed after the delete.
 
         Args:
             unit_id (UUID): The unit ID to filter by.
@@ -456,6 +843,7 @@ class DBSession:
             DatabaseInteractionException: If there is an error during the deletion operation.
         """
         try:
+            await self.__write_buffer.flush()
             query: dict = {
                 "query": {
                     "term": {
@@ -463,7 +851,7 @@ class DBSession:
                     }
                 }
             }
-            response = self.__client.delete_by_query(
+            response = await self.__client.delete_by_query(
                 index=self.__index_name,
                 body=query,
                 refresh=True,
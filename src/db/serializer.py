@@ -0,0 +1,44 @@
+"""_summary_
+This module defines the orjson based serializer used by the OpenSearch client.
+The default serializer of opensearch-py relies on the stdlib json module,
+which is the dominant cost of the bulk indexing and search_after paging loops.
+"""
+
+from typing import Any
+import orjson
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
+
+
+class OrjsonSerializer(JSONSerializer):
+    """_summary_
+    JSONSerializer that encodes and decodes request/response bodies with orjson.
+    UUID and datetime are serialized natively by orjson (naive datetimes as UTC),
+    any other type falls back to JSONSerializer.default.
+    """
+
+    __OPTIONS: int = orjson.OPT_SERIALIZE_UUID | orjson.OPT_NAIVE_UTC
+    ## every JSON content type a response may be tagged with
+    MIMETYPES: tuple[str, ...] = ("application/json", "application/vnd.elasticsearch+json")
+
+    def registry(self) -> dict[str, "OrjsonSerializer"]:
+        """_summary_
+        Map every JSON mimetype to this serializer, for the `serializers` option of the client,
+        so that no response falls back to the stdlib json deserializer.
+        """
+        return {mimetype: self for mimetype in self.MIMETYPES}
+
+    def dumps(self, data: Any) -> str:
+        ## strings are passed through as-is, same as the stdlib serializer
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=self.__OPTIONS).decode("utf-8")
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e)
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e)
@@ -0,0 +1,8 @@
+# __init__.py
+
+__all__ = [
+    "TestSyslogWriteBuffer",
+    "TestFlattenBool",
+    "TestGetSyslogBySubquery",
+    "TestBulkStore",
+]
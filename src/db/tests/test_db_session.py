@@ -0,0 +1,247 @@
+"""_summary
+This module is for unit tests for the query rewriting, the subquery search and the bulk writes of the DBSession class.
+"""
+
+import asyncio
+import copy
+import unittest
+from datetime import datetime
+from unittest import mock
+from uuid import uuid4
+from opensearchpy.exceptions import TransportError
+from db.db_model import SyslogModel
+from db.db_session import DBSession
+from db.write_buffer import SyslogWriteBuffer
+
+
+def flatten(query: dict) -> dict:
+    ## the rewriter only reads its argument, so no connected session is needed
+    session = DBSession.__new__(DBSession)
+    return session._DBSession__flatten_bool(query)
+
+
+TERM_A = {"term": {"a": 1}}
+TERM_B = {"term": {"b": 2}}
+TERM_C = {"term": {"c": 3}}
+
+
+class TestFlattenBool(unittest.TestCase):
+    """Unit tests for DBSession.__flatten_bool."""
+
+    def test_splice_same_occurrence(self):
+        """Test that must in must, filter in filter and should in should are spliced."""
+        for occur in ("must", "filter", "should"):
+            query = {"bool": {occur: [TERM_A, {"bool": {occur: [TERM_B, TERM_C]}}]}}
+            self.assertEqual(flatten(query), {"bool": {occur: [TERM_A, TERM_B, TERM_C]}})
+
+    def test_splice_nested_levels(self):
+        """Test that nesting of several levels is spliced bottom-up."""
+        query = {"bool": {"must": [{"bool": {"must": [{"bool": {"must": TERM_A}}, TERM_B]}}]}}
+        self.assertEqual(flatten(query), {"bool": {"must": [TERM_A, TERM_B]}})
+
+    def test_keep_must_not_nesting(self):
+        """Test that must_not in must_not is not spliced (double negation)."""
+        query = {"bool": {"must_not": [{"bool": {"must_not": [TERM_A]}}]}}
+        self.assertEqual(flatten(query), query)
+
+    def test_keep_mixed_nesting(self):
+        """Test that a nested bool with another occurrence is kept."""
+        query = {"bool": {"must": [{"bool": {"should": [TERM_A, TERM_B]}}]}}
+        self.assertEqual(flatten(query), query)
+        query = {"bool": {"must": [{"bool": {"must": [TERM_A], "filter": [TERM_B]}}]}}
+        self.assertEqual(flatten(query), query)
+
+    def test_deduplicate(self):
+        """Test that identical clauses of an occurrence are sent once, regardless of key order."""
+        query = {"bool": {
+            "filter": [{"range": {"t": {"gte": 1, "lte": 2}}}, {"range": {"t": {"lte": 2, "gte": 1}}}],
+            "must_not": [TERM_A, TERM_A],
+        }}
+        self.assertEqual(flatten(query), {"bool": {
+            "filter": [{"range": {"t": {"gte": 1, "lte": 2}}}],
+            "must_not": [TERM_A],
+        }})
+
+    def test_match_all(self):
+        """Test that match_all is dropped next to other clauses and kept alone."""
+        self.assertEqual(
+            flatten({"bool": {"must": [{"match_all": {}}, TERM_A]}}),
+            {"bool": {"must": [TERM_A]}},
+        )
+        self.assertEqual(
+            flatten({"bool": {"filter": [{"match_all": {}}]}}),
+            {"bool": {"filter": [{"match_all": {}}]}},
+        )
+
+    def test_single_clause_normalized(self):
+        """Test that a single clause given as an object becomes a list."""
+        self.assertEqual(flatten({"bool": {"must": TERM_A}}), {"bool": {"must": [TERM_A]}})
+
+    def test_minimum_should_match_keeps_should(self):
+        """Test that should clauses counted by minimum_should_match are neither spliced nor deduplicated."""
+        query = {"bool": {
+            "should": [TERM_A, TERM_A, {"bool": {"should": [TERM_B, TERM_C]}}],
+            "minimum_should_match": 2,
+            "must": [TERM_A, {"bool": {"must": [TERM_B]}}],
+        }}
+        self.assertEqual(flatten(query), {"bool": {
+            "should": [TERM_A, TERM_A, {"bool": {"should": [TERM_B, TERM_C]}}],
+            "minimum_should_match": 2,
+            "must": [TERM_A, TERM_B],
+        }})
+
+    def test_nested_minimum_should_match_not_spliced(self):
+        """Test that a nested should bool with its own minimum_should_match is kept."""
+        query = {"bool": {"should": [{"bool": {"should": [TERM_A, TERM_B], "minimum_should_match": 2}}]}}
+        self.assertEqual(flatten(query), query)
+
+    def test_input_not_modified(self):
+        """Test that the input query is left as it is."""
+        query = {"query": {"bool": {"must": [TERM_A, TERM_A, {"bool": {"must": [TERM_B]}}]}}}
+        original = copy.deepcopy(query)
+        self.assertEqual(flatten(query), {"query": {"bool": {"must": [TERM_A, TERM_B]}}})
+        self.assertEqual(query, original)
+
+
+class FakeOpenSearch:
+    """Serves sorted search_after pages over PITs from a list of (timestamp, id, x) documents."""
+
+    def __init__(self, docs: list[tuple[int, str, str]]):
+        self.docs = sorted(docs)
+        self.opened: list[str] = []
+        self.closed: list[str] = []
+        self.searches: list[dict] = []
+
+    async def create_point_in_time(self, index: str, keep_alive: str) -> dict:
+        pit_id = f"pit{len(self.opened)}"
+        self.opened.append(pit_id)
+        return {"pit_id": pit_id}
+
+    async def delete_point_in_time(self, body: dict) -> dict:
+        self.closed.extend(body["pit_id"])
+        return {}
+
+    async def search(self, body: dict, filter_path: list[str]) -> dict:
+        self.searches.append({"pit": dict(body["pit"]), "search_after": body.get("search_after")})
+        wanted = {clause["term"]["x"] for clause in body["query"]["bool"].get("should", [])}
+        after = tuple(body["search_after"]) if body.get("search_after") else None
+        hits = [
+            {"_source": {"raw_data": {"id": doc_id}}, "sort": [ts, doc_id]}
+            for ts, doc_id, x in self.docs
+            if x in wanted and (after is None or (ts, doc_id) > after)
+        ][:body["size"]]
+        ## the server renews the PIT id on every page
+        return {"pit_id": body["pit"]["id"] + "'", "hits": {"hits": hits}}
+
+
+def subquery(x: str) -> dict:
+    return {"query": {"bool": {"should": [{"term": {"x": x}}]}}}
+
+
+class TestGetSyslogBySubquery(unittest.TestCase):
+    """Unit tests for DBSession.get_syslog_by_subquery."""
+
+    def test_subqueries_share_one_pit_and_merge_in_order(self):
+        """Test that every subquery pages over one PIT and the runs are merged by sort value."""
+        async def run():
+            docs = [(ts, f"a{ts}", "a") for ts in range(0, 250, 2)] + \
+                   [(ts, f"b{ts}", "b") for ts in range(1, 250, 2)]
+            client = FakeOpenSearch(docs)
+            session = DBSession.__new__(DBSession)
+            session._DBSession__client = client
+            session._DBSession__index_name = "syslog"
+            session._DBSession__logger = mock.Mock()
+            sequence = await session.get_syslog_by_subquery(uuid4(), "exec", [subquery("a"), subquery("b")])
+            self.assertEqual([raw["id"] for raw in sequence.syslogs], [doc_id for _, doc_id, _ in client.docs])
+            ## one PIT for every subquery, closed with its latest id
+            self.assertEqual(client.opened, ["pit0"])
+            self.assertEqual(len(client.closed), 1)
+            self.assertEqual(client.closed[0], client.searches[-1]["pit"]["id"] + "'")
+            ## 125 hits per subquery with pages of 100: two pages each, the second one paging after the first
+            self.assertEqual(len(client.searches), 4)
+            self.assertIsNone(client.searches[0]["search_after"])
+            self.assertIsNone(client.searches[2]["search_after"])
+            self.assertIsNotNone(client.searches[1]["search_after"])
+        asyncio.run(run())
+
+
+def make_syslogs(count: int) -> list[SyslogModel]:
+    return [
+        SyslogModel(unit_id=uuid4(), span_id="span", trace_id="trace", timestamp=datetime.now(), raw_data={"n": n})
+        for n in range(count)
+    ]
+
+
+def make_bulk_session(chunk_size: int) -> DBSession:
+    session = DBSession.__new__(DBSession)
+    session._DBSession__client = mock.Mock()
+    session._DBSession__index_name = "syslog"
+    session._DBSession__logger = mock.Mock()
+    session._DBSession__chunk_size = chunk_size
+    ## one partition at a time, so the order of the bulk calls is the order of the partitions
+    session._DBSession__thread_count = 1
+    session._DBSession__max_chunk_bytes = 10 * 1024 * 1024
+    return session
+
+
+class FakeAsyncBulk:
+    """Stands in for async_bulk. Every call takes the next outcome: an exception to raise,
+    or {position in the call: status} of the documents to reject. Accepted documents are indexed by _id."""
+
+    def __init__(self, outcomes: list):
+        self.outcomes = outcomes
+        self.calls: list[list[str]] = []
+        self.indexed: list[str] = []
+
+    async def __call__(self, client, actions, **kwargs):
+        ids = [action["_id"] for action in actions]
+        self.calls.append(ids)
+        outcome = self.outcomes.pop(0) if self.outcomes else {}
+        if isinstance(outcome, Exception):
+            raise outcome
+        errors = []
+        for position, doc_id in enumerate(ids):
+            status = outcome.get(position, 201)
+            if status >= 300:
+                errors.append({"index": {"_id": doc_id, "status": status, "error": "rejected"}})
+            else:
+                self.indexed.append(doc_id)
+        return len(ids) - len(errors), errors
+
+
+def store(session: DBSession, fake: FakeAsyncBulk, syslogs: list[SyslogModel]):
+    async def run():
+        buffer = SyslogWriteBuffer(mock.Mock(), session._DBSession__bulk_store, chunk_size=100,
+                                   flush_interval_ms=60_000, retry_count=3, retry_delay_ms=1)
+        await buffer.append(syslogs)
+        await buffer.close()
+    with mock.patch("db.db_session.async_bulk", fake):
+        asyncio.run(run())
+
+
+class TestBulkStore(unittest.TestCase):
+    """Unit tests for DBSession.__bulk_store behind the write-behind buffer."""
+
+    def test_failed_partition_is_retried_alone(self):
+        """Test that when the second of two partitions raises, only its documents are sent again."""
+        fake = FakeAsyncBulk([{}, TransportError(503, "unavailable", {})])
+        store(make_bulk_session(chunk_size=2), fake, make_syslogs(4))
+        first, second, retry = fake.calls
+        self.assertEqual(retry, second)
+        ## every document is indexed exactly once
+        self.assertEqual(sorted(fake.indexed), sorted(first + second))
+
+    def test_retry_keeps_document_ids(self):
+        """Test that a retried partition is sent with the same document ids, so it overwrites."""
+        fake = FakeAsyncBulk([TransportError(503, "timeout", {})])
+        store(make_bulk_session(chunk_size=10), fake, make_syslogs(3))
+        self.assertEqual(fake.calls[0], fake.calls[1])
+        self.assertEqual(len(set(fake.calls[0])), 3)
+
+    def test_only_retryable_item_errors_are_retried(self):
+        """Test that a document rejected with 429 is retried and a document rejected with 400 is not."""
+        fake = FakeAsyncBulk([{0: 429, 1: 400}])
+        store(make_bulk_session(chunk_size=10), fake, make_syslogs(3))
+        self.assertEqual(len(fake.calls), 2)
+        self.assertEqual(fake.calls[1], fake.calls[0][:1])
+        self.assertEqual(sorted(fake.indexed), sorted([fake.calls[0][0], fake.calls[0][2]]))
@@ -0,0 +1,158 @@
+"""_summary
+This module is for unit tests for the SyslogWriteBuffer class.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+from db.write_buffer import SyslogWriteBuffer
+
+
+class Recorder:
+    """Flush function recording the written (document id, object) batches, optionally failing the first calls."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.batches: list[list] = []
+        self.calls = 0
+        self.failures = failures
+        self.delay = delay
+
+    async def __call__(self, batch: list):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise RuntimeError("bulk request failed")
+        self.batches.append(list(batch))
+        return []
+
+    @property
+    def written(self) -> list:
+        return [item for batch in self.batches for _, item in batch]
+
+
+class TestSyslogWriteBuffer(unittest.TestCase):
+    """Unit tests for SyslogWriteBuffer."""
+
+    def test_capacity_below_chunk_size(self):
+        """Test that the capacity must hold at least one chunk."""
+        with self.assertRaises(ValueError):
+            SyslogWriteBuffer(mock.Mock(), Recorder(), capacity=1, chunk_size=2)
+
+    def test_flush(self):
+        """Test that flush writes every buffered object in order."""
+        async def run():
+            recorder = Recorder()
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=10, flush_interval_ms=60_000)
+            await buffer.append([1, 2, 3])
+            self.assertEqual(len(buffer), 3)
+            await buffer.flush()
+            self.assertEqual(len(buffer), 0)
+            self.assertEqual(recorder.written, [1, 2, 3])
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_drains_on_interval(self):
+        """Test that the background task writes buffered objects after flush_interval_ms."""
+        async def run():
+            recorder = Recorder()
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=10, flush_interval_ms=10)
+            await buffer.append([1])
+            await asyncio.sleep(0.1)
+            self.assertEqual(recorder.written, [1])
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_drains_on_chunk_size(self):
+        """Test that reaching chunk_size wakes the background task before the interval."""
+        async def run():
+            recorder = Recorder()
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=2, flush_interval_ms=60_000)
+            await buffer.append([1, 2])
+            await asyncio.sleep(0.05)
+            self.assertEqual(recorder.written, [1, 2])
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_backpressure(self):
+        """Test that append waits for the drain when the buffer is full, and nothing is lost."""
+        async def run():
+            recorder = Recorder(delay=0.01)
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, capacity=4, chunk_size=2, flush_interval_ms=60_000)
+            await buffer.append(list(range(10)))
+            self.assertLessEqual(len(buffer), 4)
+            await buffer.close()
+            self.assertEqual(recorder.written, list(range(10)))
+            self.assertTrue(all(len(batch) <= 4 for batch in recorder.batches))
+        asyncio.run(run())
+
+    def test_close(self):
+        """Test that close writes the remaining objects and rejects further appends."""
+        async def run():
+            recorder = Recorder()
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=10, flush_interval_ms=60_000)
+            await buffer.append([1, 2])
+            await buffer.close()
+            self.assertEqual(recorder.written, [1, 2])
+            with self.assertRaises(RuntimeError):
+                await buffer.append([3])
+        asyncio.run(run())
+
+    def test_retry_failed_batch(self):
+        """Test that a failed batch is retried and then written."""
+        async def run():
+            recorder = Recorder(failures=2)
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=10, flush_interval_ms=60_000,
+                                       retry_count=3, retry_delay_ms=1)
+            await buffer.append([1, 2])
+            await buffer.flush()
+            self.assertEqual(recorder.calls, 3)
+            self.assertEqual(recorder.written, [1, 2])
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_drop_after_retries(self):
+        """Test that a batch failing every retry is logged and dropped."""
+        async def run():
+            logger = mock.Mock()
+            recorder = Recorder(failures=100)
+            buffer = SyslogWriteBuffer(logger, recorder, chunk_size=10, flush_interval_ms=60_000,
+                                       retry_count=2, retry_delay_ms=1)
+            await buffer.append([1])
+            await buffer.flush()
+            self.assertEqual(recorder.calls, 3)
+            self.assertEqual(len(buffer), 0)
+            logger.error.assert_called_once()
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_retry_only_unwritten_documents(self):
+        """Test that only the documents reported as not written are retried, with their ids."""
+        async def run():
+            calls: list[list] = []
+
+            async def flush_func(batch: list) -> list:
+                calls.append(list(batch))
+                ## the first attempt writes every document but the last one
+                return batch[-1:] if len(calls) == 1 else []
+
+            buffer = SyslogWriteBuffer(mock.Mock(), flush_func, chunk_size=10, flush_interval_ms=60_000,
+                                       retry_count=3, retry_delay_ms=1)
+            await buffer.append(["a", "b", "c"])
+            await buffer.flush()
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(calls[1], calls[0][-1:])
+            await buffer.close()
+        asyncio.run(run())
+
+    def test_document_ids(self):
+        """Test that every buffered object gets its own id."""
+        async def run():
+            recorder = Recorder()
+            buffer = SyslogWriteBuffer(mock.Mock(), recorder, chunk_size=10, flush_interval_ms=60_000)
+            await buffer.append([1, 2])
+            await buffer.append([3])
+            await buffer.close()
+            ids = [doc_id for batch in recorder.batches for doc_id, _ in batch]
+            self.assertEqual(len(set(ids)), 3)
+        asyncio.run(run())
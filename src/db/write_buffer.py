@@ -0,0 +1,198 @@
+"""_summary_
+This module defines the SyslogWriteBuffer class, a write-behind batching layer
+in front of the bulk indexing of DBSession.
+Producers append SyslogObjects to a bounded in-memory buffer and return immediately,
+a background task drains the buffer every flush_interval_ms or as soon as chunk_size
+documents are pending, so producer latency is decoupled from the OpenSearch round trip.
+!!!NOTICE!!!
+`append` returns once the SyslogObjects are buffered, before they are written, so a caller
+that got success can still lose them:
+- on a crash, every buffered SyslogObject not yet drained is lost. The loss window is bounded
+  by flush_interval_ms (plus the duration of the bulk requests in flight).
+- documents whose write keeps failing are retried retry_count times with backoff, then logged
+  and dropped.
+Every buffered SyslogObject gets a document id once, when it is appended. Only the documents
+a write reports as not written are retried, and with the same id, so a retry overwrites what
+a failed attempt may already have indexed instead of adding a duplicate.
+Call `flush()` when a write must be durable before returning.
+"""
+
+import asyncio
+from collections import deque
+from itertools import count
+from typing import Any, Awaitable, Callable, Iterator, Optional
+from uuid import uuid4
+from db.db_model import SyslogModel
+
+## (document id, SyslogObject) pair handed to the flush function
+BufferedSyslog = tuple[str, SyslogModel]
+
+
+class SyslogWriteBuffer:
+    """_summary_
+    SyslogWriteBuffer buffers SyslogObjects and writes them in batches with a background task.
+    """
+    __logger: Any
+    __flush_func: Callable[[list[BufferedSyslog]], Awaitable[list[BufferedSyslog]]]
+    __buffer: deque
+    __id_prefix: str
+    __id_counter: Iterator[int]
+    __capacity: int
+    __chunk_size: int
+    __flush_interval: float
+    __retry_count: int
+    __retry_delay: float
+
+    __task: Optional[asyncio.Task]
+    __ready: Optional[asyncio.Event]
+    __space: Optional[asyncio.Event]
+    __lock: Optional[asyncio.Lock]
+    __closed: bool
+
+    def __init__(self,
+                 loger: Any,
+                 flush_func: Callable[[list[BufferedSyslog]], Awaitable[list[BufferedSyslog]]],
+                 capacity: int = 100_000,
+                 chunk_size: int = 2000,
+                 flush_interval_ms: int = 100,
+                 retry_count: int = 3,
+                 retry_delay_ms: int = 500):
+        """_summary_
+        Initializes the SyslogWriteBuffer.
+
+        Args:
+            loger (Any): Logger instance for logging.
+            flush_func (Callable[[list[BufferedSyslog]], Awaitable[list[BufferedSyslog]]]): Coroutine that writes
+                a batch of (document id, SyslogObject) pairs and returns the pairs that were not written
+                and may be retried.
+            capacity (int): Maximum number of buffered SyslogObjects. Producers wait when it is reached.
+            chunk_size (int): Number of pending SyslogObjects that triggers an immediate drain.
+            flush_interval_ms (int): Maximum time in milliseconds a SyslogObject stays in the buffer.
+            retry_count (int): Number of retries of a failed batch before it is dropped.
+            retry_delay_ms (int): Delay in milliseconds before the first retry, doubled on every retry.
+        """
+        if capacity < chunk_size:
+            raise ValueError("capacity must be greater than or equal to chunk_size.")
+        self.__logger = loger
+        self.__flush_func = flush_func
+        self.__buffer = deque()
+        ## unique per buffer instance (and so per worker process), the counter makes it unique per document
+        self.__id_prefix = uuid4().hex
+        self.__id_counter = count()
+        self.__capacity = capacity
+        self.__chunk_size = chunk_size
+        self.__flush_interval = flush_interval_ms / 1000
+        self.__retry_count = max(retry_count, 0)
+        self.__retry_delay = retry_delay_ms / 1000
+        ## asyncio primitives are created lazily on the running event loop
+        self.__task = None
+        self.__ready = None
+        self.__space = None
+        self.__lock = None
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return len(self.__buffer)
+
+    def __ensure_started(self):
+        """_summary_
+        Start the background drain task on the running event loop.
+        """
+        if self.__task is not None and not self.__task.done():
+            return
+        self.__ready = asyncio.Event()
+        self.__space = asyncio.Event()
+        self.__lock = asyncio.Lock()
+        self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def append(self, syslog_bulk: list[SyslogModel]):
+        """_summary_
+        Append SyslogObjects to the buffer.
+        Waits for the drain task to free space when the buffer is full (backpressure).
+
+        Args:
+            syslog_bulk (list[SyslogModel]): The SyslogObjects to buffer.
+
+        Raises:
+            RuntimeError: If the buffer is already closed.
+        """
+        if self.__closed:
+            raise RuntimeError("SyslogWriteBuffer is closed.")
+        self.__ensure_started()
+        for syslog_object in syslog_bulk:
+            while len(self.__buffer) >= self.__capacity:
+                ## wake the drainer and wait until it has taken a batch
+                self.__space.clear()
+                self.__ready.set()
+                await self.__space.wait()
+            self.__buffer.append((f"{self.__id_prefix}-{next(self.__id_counter)}", syslog_object))
+        if len(self.__buffer) >= self.__chunk_size:
+            self.__ready.set()
+
+    async def __run(self):
+        """_summary_
+        Background task that drains the buffer every flush_interval or when chunk_size is reached.
+        """
+        while not self.__closed:
+            try:
+                await asyncio.wait_for(self.__ready.wait(), timeout=self.__flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.__ready.clear()
+            await self.__drain()
+
+    async def __drain(self):
+        """_summary_
+        Write every buffered SyslogObject.
+        """
+        if self.__lock is None:
+            return
+        async with self.__lock:
+            while self.__buffer:
+                batch: list[BufferedSyslog] = [self.__buffer.popleft() for _ in range(len(self.__buffer))]
+                self.__space.set()
+                await self.__write(batch)
+
+    async def __write(self, batch: list[BufferedSyslog]):
+        """_summary_
+        Write a batch, retrying the documents that were not written with exponential backoff.
+        A write that raises retries the whole batch, which is safe because the document ids do not change.
+        Documents still failing after retry_count retries are logged and dropped,
+        so that the buffer never blocks producers forever.
+        """
+        pending: list[BufferedSyslog] = batch
+        for attempt in range(self.__retry_count + 1):
+            try:
+                pending = await self.__flush_func(pending)
+                if not pending:
+                    return
+                error: Any = f"{len(pending)} documents were not written"
+            except Exception as e:
+                error = e
+            if attempt == self.__retry_count:
+                self.__logger.error(
+                    f"Dropped {len(pending)} buffered SyslogObjects after {attempt + 1} failed attempts: {error}"
+                )
+                return
+            self.__logger.warning(
+                f"Failed to flush {len(pending)} buffered SyslogObjects (attempt {attempt + 1}), retrying: {error}"
+            )
+            await asyncio.sleep(self.__retry_delay * (2 ** attempt))
+
+    async def flush(self):
+        """_summary_
+        Write every buffered SyslogObject now.
+        """
+        await self.__drain()
+
+    async def close(self):
+        """_summary_
+        Stop the background task and write the remaining SyslogObjects.
+        """
+        self.__closed = True
+        if self.__task is not None:
+            ## wake the task instead of cancelling it, so an in-flight bulk is not interrupted
+            self.__ready.set()
+            await self.__task
+            self.__task = None
+        await self.__drain()
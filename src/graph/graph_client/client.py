@@ -6,12 +6,26 @@ and provides methods for interacting with the graph database.
 
 from __future__ import annotations
 import asyncio
-from typing import List, Dict, Union, Tuple, Any, LiteralString, Callable, cast
+import random
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import List, Dict, Union, Tuple, Any, AsyncIterator, LiteralString, Callable, cast
 from pydantic import SecretStr
 from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncResult, AsyncSession, ResultSummary
 from neo4j.exceptions import ServiceUnavailable, TransientError
 from .node import Node, Relationship, NodeExtension
 
+
+@lru_cache(maxsize=256)
+def _quote_label(label: str) -> str:
+    """_summary_
+    Backtick-quote a label or relationship type for Cypher, escaping embedded backticks.
+    The schema has a small set of labels, so the quoted forms are built once.
+    """
+    return "`" + label.replace("`", "``") + "`"
+
+
 class GraphClient:
 
     __logger: Any
@@ -21,8 +35,17 @@ class GraphClient:
     __retry_count: int
     __retry_delay: float
 
+    ## upper bound of a single retry delay in seconds
+    MAX_DELAY: float = 30.0
+
     _primary_key_map: Dict[str, Union[str, Tuple[str, ...]]]
 
+    _session_pool: asyncio.Queue[AsyncSession]
+    _session_sema: asyncio.Semaphore
+    _write_sema: asyncio.Semaphore
+    _merge_node_cypher_cache: Dict[Tuple[Any, ...], LiteralString]
+    _rel_cypher_cache: Dict[Tuple[Any, ...], LiteralString]
+
     def __init__(
             self,
             logger: Any,
@@ -61,17 +84,59 @@ class GraphClient:
             keep_alive=keep_alive,
         )
 
-        self.__retry_count = retry_count
+        ## at least one attempt, so the retry loops always return or raise
+        self.__retry_count = max(retry_count, 1)
         self.__retry_delay = retry_delay
 
         self._primary_key_map: Dict[str, Union[str, Tuple[str, ...]]] = primary_keys or {}
 
+        ## idle sessions are reused across calls, the semaphore bounds the borrowed ones to the connection pool size
+        self._session_pool = asyncio.Queue()
+        self._session_sema = asyncio.Semaphore(max_connection_pool_size)
+        ## bounds the batched writes merge_graph keeps in flight
+        self._write_sema = asyncio.Semaphore(max_connection_pool_size)
+
+        ## built Cypher per query shape
+        self._merge_node_cypher_cache = {}
+        self._rel_cypher_cache = {}
+
     async def close(self) -> None:
         """_summary_
-        Closes the Neo4j database connection.
+        Closes the pooled sessions and the Neo4j database connection.
         """
+        while not self._session_pool.empty():
+            session = self._session_pool.get_nowait()
+            await session.close()
         await self.__driver.close()
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """_summary_
+        Borrows an idle session from the pool, or opens a new one when none is idle.
+        At most max_connection_pool_size sessions are borrowed at a time, further callers wait for one to be released.
+        A session is used by a single caller at a time (sessions are not concurrency-safe),
+        and a session whose work raised is closed instead of being returned to the pool.
+
+        Yields:
+            AsyncSession: The borrowed session.
+        """
+        ## the slot is released on every exit path, so a discarded session also wakes a waiting caller
+        async with self._session_sema:
+            try:
+                session: AsyncSession = self._session_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                session = self.__driver.session(database=self.__database)
+            try:
+                yield session
+            except BaseException:
+                ## the session may hold a broken connection, do not reuse it
+                try:
+                    await session.close()
+                except Exception as e:
+                    self.__logger.warning(f"Failed to close Neo4j session: {e}")
+                raise
+            self._session_pool.put_nowait(session)
+
     async def run(self, cypher: LiteralString, **params: Any) -> List[dict[str, Any]]:
         """_summary_
         Executes a Cypher query against the Neo4j database.
@@ -85,7 +150,7 @@ class GraphClient:
         """
         for attempt_count in range(self.__retry_count):
             try:
-                async with self.__driver.session(database=self.__database) as session:
+                async with self._session() as session:
                     ## set query parameters
 
                     result: AsyncResult = await session.run(cypher, **params)
@@ -101,8 +166,7 @@ class GraphClient:
                     raise e
                 # sleep for retry delay
                 # delay increases with each attempt (exponential backoff)
-                await asyncio.sleep(self.__retry_delay * (attempt_count ** 2))
-        raise RuntimeError("Unreachable code reached in run()")
+                await asyncio.sleep(self._backoff_delay(attempt_count))
 
     async def consume(self, cypher: LiteralString, **params: Any) -> ResultSummary:
         """_summary_
@@ -117,7 +181,7 @@ class GraphClient:
         """
         for attempt_count in range(self.__retry_count):
             try:
-                async with self.__driver.session(database=self.__database) as session:
+                async with self._session() as session:
                     ## set query parameters
                     result: AsyncResult = await session.run(cypher, **params)
                     return await result.consume()
@@ -132,9 +196,8 @@ class GraphClient:
                     raise e
                 # sleep for retry delay
                 # delay increases with each attempt (exponential backoff)
-                await asyncio.sleep(self.__retry_delay * (attempt_count ** 2))
-        raise RuntimeError("Unreachable code reached in consume()")
-        
+                await asyncio.sleep(self._backoff_delay(attempt_count))
+
 
     async def merge_node(self, sub_node: Node, primary_label: str, primary_key: str) -> None:
         """_summary_
@@ -145,114 +208,237 @@ class GraphClient:
             primary_label (str): The primary label of the node.
             primary_key (str): The primary key property of the node.
         """
+        await self.merge_nodes([sub_node], primary_label, primary_key)
 
-        ## extract labels and properties and check primary key exists
-        labels, props = NodeExtension.extract_node(sub_node)
-        if primary_key not in props:
-            raise ValueError(
-                f"merge() needs property '{primary_key}' in node props. got: {list(props.keys())}"
-            )
-        pk_val = props[primary_key]
-        extra_labels = [elem for elem in labels if elem != primary_label]
+    async def merge_nodes(self, nodes: List[Node], primary_label: str, primary_key: str) -> None:
+        """_summary_
+        Merges nodes into the Neo4j database in batches.
+        Nodes are grouped by their extra labels and every group is merged
+        with a single UNWIND query, in one write transaction per group.
 
-        ## generate query and params
-        query = [
-            f"MERGE (n:`{primary_label}` {{{primary_key}: $pk}})",
-            "SET n += $props",
-        ]
-        for l in extra_labels:
-            query.append(f"SET n:`{l}`")
-        params = {"pk": pk_val, "props": props}
-        cypher_str = "\n".join(query)
-        cypher = cast(LiteralString, cypher_str)
-
-        ## execute query
-        async with self.__driver.session(database=self.__database) as session:
-            await self._retry_write(
-                session,
-                self._work_transaction_async,
-                cypher,
-                **params
-            )
+        Args:
+            nodes (List[Node]): The nodes to merge.
+            primary_label (str): The primary label of the nodes.
+            primary_key (str): The primary key property of the nodes.
+
+        Raises:
+            ValueError: If a node does not have the primary key property.
+        """
+
+        ## extract labels and properties and check primary key exists
+        groups: Dict[Tuple[str, ...], List[dict[str, Any]]] = {}
+        for sub_node in nodes:
+            labels, props = NodeExtension.extract_node_view(sub_node)
+            if primary_key not in props:
+                raise ValueError(
+                    f"merge() needs property '{primary_key}' in node props. got: {list(props.keys())}"
+                )
+            extra_labels = tuple(sorted(elem for elem in labels if elem != primary_label))
+            groups.setdefault(extra_labels, []).append({"pk": props[primary_key], "props": props})
+        if not groups:
             return
-        raise RuntimeError("Unreachable code reached in merge_node()")
+
+        async with self._session() as session:
+            for extra_labels, rows in groups.items():
+                ## generate query and params
+                cypher = self._merge_nodes_cypher(primary_label, extra_labels, primary_key)
+
+                ## execute query
+                await self._retry_write(
+                    session,
+                    self._work_transaction_write_async,
+                    cypher,
+                    rows=rows
+                )
 
     async def create_relation(self, rel: Relationship) -> None:
-        # extract start/end nodes
-        slabels, sprops = NodeExtension.extract_node(rel.start)
-        elabels, eprops = NodeExtension.extract_node(rel.end)
-        
-        if not slabels or not elabels:
-            raise ValueError("Both start/end nodes must have at least one label")
-
-        start_primary_label = slabels[0]
-        end_primary_label = elabels[0]
-
-        ## get schema primary keys from map
-        start_primary_key = self._primary_key_map.get(start_primary_label)
-        end_primary_key = self._primary_key_map.get(end_primary_label)
-        if start_primary_key is None or end_primary_key is None:
-            raise ValueError(
-                f"primary_keys mapping required for labels: {start_primary_label} -> ?, {end_primary_label} -> ?"
-            )
-        
-        ## pick id values
-        s_id = NodeExtension.pick_id(sprops, start_primary_key)
-        e_id = NodeExtension.pick_id(eprops, end_primary_key)
-
-        ## generate cypher query
-        set_extra_start_properties = [f"SET s:`{l}`" for l in slabels[1:]]
-        set_extra_exit_properties = [f"SET e:`{l}`" for l in elabels[1:]]
-
-        s_match = ", ".join([f"{k}: $s_id.{k}" for k in s_id.keys()])
-        e_match = ", ".join([f"{k}: $e_id.{k}" for k in e_id.keys()])
-
-        rel_props = rel.properties or {}
-        rel_set = "SET r += $rprops" if rel_props else ""
-
-        cypher = f"""
-        MERGE (s:`{start_primary_label}` {{ {s_match} }})
-        SET s += $sprops
-        {' '.join(set_extra_start_properties)}
-        MERGE (e:`{end_primary_label}` {{ {e_match} }})
-        SET e += $eprops
-        {' '.join(set_extra_exit_properties)}
-        MERGE (s)-[r:`{rel.type}`]->(e)
-        {rel_set}
-        RETURN elementId(r) as rid
+        """_summary_
+        Merges a relationship and its start/end nodes into the Neo4j database.
+
+        Args:
+            rel (Relationship): The relationship to merge.
         """
+        await self.create_relations([rel])
+
+    async def create_relations(self, rels: List[Relationship]) -> None:
+        """_summary_
+        Merges relationships and their start/end nodes into the Neo4j database in batches.
+        Relationships are grouped by (start labels, end labels, type) and every group is merged
+        with a single UNWIND query. All groups are written in one write transaction.
 
-        # attach params
-        params = {
-            "s_id": s_id,
-            "e_id": e_id,
-            "sprops": sprops,
-            "eprops": eprops,
-            "rprops": rel_props,
-        }
-
-        async with self.__driver.session(database=self.__database) as session:
-            await self._retry_write(session=session, func=self._work_transaction_async, cypher=cypher, **params)
+        Args:
+            rels (List[Relationship]): The relationships to merge.
+
+        Raises:
+            ValueError: If a start/end node has no label or no primary key mapping.
+        """
+        groups: defaultdict[Tuple[Any, ...], List[dict[str, Any]]] = defaultdict(list)
+        for rel in rels:
+            # extract start/end nodes
+            slabels, sprops = NodeExtension.extract_node_view(rel.start)
+            elabels, eprops = NodeExtension.extract_node_view(rel.end)
+
+            if not slabels or not elabels:
+                raise ValueError("Both start/end nodes must have at least one label")
+
+            start_primary_label = slabels[0]
+            end_primary_label = elabels[0]
+
+            ## get schema primary keys from map
+            start_primary_key = self._primary_key_map.get(start_primary_label)
+            end_primary_key = self._primary_key_map.get(end_primary_label)
+            if start_primary_key is None or end_primary_key is None:
+                raise ValueError(
+                    f"primary_keys mapping required for labels: {start_primary_label} -> ?, {end_primary_label} -> ?"
+                )
+
+            ## pick id values
+            s_id = NodeExtension.pick_id(sprops, start_primary_key)
+            e_id = NodeExtension.pick_id(eprops, end_primary_key)
+
+
+            signature = (
+                start_primary_label, tuple(slabels[1:]), tuple(s_id.keys()),
+                end_primary_label, tuple(elabels[1:]), tuple(e_id.keys()),
+                rel.type,
+            )
+            groups[signature].append({
+                "s_id": s_id, "e_id": e_id,
+                "sprops": sprops, "eprops": eprops,
+                "rprops": rel.properties or {},
+            })
+        if not groups:
             return
-            # ## check return type is correct
-            # if rows is None:
-            #     return None
-            # if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
-            #     raise ValueError("Unexpected result format from create_relation()")
-            # return rows[0].get("rid")
-        raise RuntimeError("Unreachable code reached in create_relation()")
 
+        statements: List[Tuple[LiteralString, dict[str, Any]]] = [
+            (self._relations_cypher(signature), {"rows": rows})
+            for signature, rows in groups.items()
+        ]
+
+        async with self._session() as session:
+            await self._retry_write(session, self._work_statements_async, statements)
+
+    async def merge_graph(self, nodes: List[Node], rels: List[Relationship], batch_size: int = 500) -> None:
+        """_summary_
+        Merges nodes and then relationships into the Neo4j database,
+        running the batched writes concurrently over the connection pool.
+        All node batches complete before the first relationship batch starts.
+
+        Args:
+            nodes (List[Node]): The nodes to merge. The first label is the primary label.
+            rels (List[Relationship]): The relationships to merge.
+            batch_size (int): Number of nodes or relationships per write transaction.
+
+        Raises:
+            ValueError: If a node has no label or no primary key mapping.
+        """
+        by_label: Dict[str, List[Node]] = {}
+        for sub_node in nodes:
+            labels, _ = NodeExtension.extract_node_view(sub_node)
+            if not labels:
+                raise ValueError("Every node must have at least one label")
+            by_label.setdefault(labels[0], []).append(sub_node)
+
+        node_writes: List[Any] = []
+        for primary_label, label_nodes in by_label.items():
+            primary_key = self._primary_key_map.get(primary_label)
+            if not isinstance(primary_key, str):
+                raise ValueError(f"single primary_keys mapping required for label: {primary_label}")
+            for i in range(0, len(label_nodes), batch_size):
+                node_writes.append(
+                    self.__bounded(self.merge_nodes(label_nodes[i:i + batch_size], primary_label, primary_key))
+                )
+        await asyncio.gather(*node_writes)
+
+        await asyncio.gather(*(
+            self.__bounded(self.create_relations(rels[i:i + batch_size]))
+            for i in range(0, len(rels), batch_size)
+        ))
+
+    async def __bounded(self, write: Any) -> None:
+        async with self._write_sema:
+            await write
+
+    def _merge_nodes_cypher(self, primary_label: str, extra_labels: Tuple[str, ...], primary_key: str) -> LiteralString:
+        """_summary_
+        Build the UNWIND MERGE query of a node group once and cache it.
+        Identical query text for identical shapes also lets Neo4j reuse its cached plan.
+        """
+        key = (primary_label, extra_labels, primary_key)
+        cypher = self._merge_node_cypher_cache.get(key)
+        if cypher is None:
+            query = [
+                "UNWIND $rows AS row",
+                f"MERGE (n:{_quote_label(primary_label)} {{{primary_key}: row.pk}})",
+                "SET n += row.props",
+            ]
+            query.extend(f"SET n:{_quote_label(l)}" for l in extra_labels)
+            cypher = cast(LiteralString, "\n".join(query))
+            self._merge_node_cypher_cache[key] = cypher
+        return cypher
+
+    def _relations_cypher(self, signature: Tuple[Any, ...]) -> LiteralString:
+        """_summary_
+        Build the UNWIND MERGE query of a relationship group once and cache it.
+        The signature is (start label, start extra labels, start id keys,
+        end label, end extra labels, end id keys, relationship type).
+        """
+        cypher = self._rel_cypher_cache.get(signature)
+        if cypher is None:
+            (start_primary_label, start_extra, s_keys,
+             end_primary_label, end_extra, e_keys,
+             rel_type) = signature
+
+            ## generate cypher query
+            s_match = ", ".join(f"{k}: row.s_id.{k}" for k in s_keys)
+            e_match = ", ".join(f"{k}: row.e_id.{k}" for k in e_keys)
+
+            set_extra_start_labels = "".join(f" SET s:{_quote_label(l)}" for l in start_extra)
+            start_clause = f"MERGE (s:{_quote_label(start_primary_label)} {{ {s_match} }}) SET s += row.sprops{set_extra_start_labels}"
+            set_extra_end_labels = "".join(f" SET e:{_quote_label(l)}" for l in end_extra)
+            end_clause = f"MERGE (e:{_quote_label(end_primary_label)} {{ {e_match} }}) SET e += row.eprops{set_extra_end_labels}"
+
+            cypher = cast(LiteralString, f"""
+            UNWIND $rows AS row
+            {start_clause}
+            WITH row, s
+            {end_clause}
+            MERGE (s)-[r:{_quote_label(rel_type)}]->(e)
+            SET r += row.rprops
+            """)
+            self._rel_cypher_cache[signature] = cypher
+        return cypher
+
+    def _backoff_delay(self, attempt_count: int) -> float:
+        """_summary_
+        Exponential backoff with jitter: retry_delay * 2^attempt, stretched by up to 50%
+        so that concurrent writers do not retry in lockstep, and capped at MAX_DELAY.
+
+        Args:
+            attempt_count (int): Zero-based index of the failed attempt.
+
+        Returns:
+            float: The delay in seconds before the next attempt.
+        """
+        return min(self.__retry_delay * (2 ** attempt_count) * (1 + random.random() * 0.5), self.MAX_DELAY)
 
     async def _retry_write(self, session: AsyncSession, func: Callable, *args: Any, **kwargs: Any) -> Any:
-        for attempt_count in range(self.__retry_count):
+        for attempt_count in range(self.__retry_count - 1):
             try:
                 return await session.execute_write(func, *args, **kwargs)
-            except (ServiceUnavailable, TransientError) as e:
-                if attempt_count == self.__retry_count - 1:
-                    raise e
-                await asyncio.sleep(self.__retry_delay * (attempt_count ** 2))
-
-        raise RuntimeError("Unreachable code reached in _retry_write()")
+            except (ServiceUnavailable, TransientError):
+                await asyncio.sleep(self._backoff_delay(attempt_count))
+        ## last attempt, its error propagates to the caller
+        return await session.execute_write(func, *args, **kwargs)
+
+    async def _work_statements_async(self, tx: Any, statements: List[Tuple[LiteralString, dict[str, Any]]]) -> None:
+        ## write-only: the results are not consumed, the transaction buffers them on commit
+        for cypher, params in statements:
+            await tx.run(cypher, **params)
+
+    async def _work_transaction_write_async(self, tx: Any, cypher: LiteralString, **params: Any) -> None:
+        ## write-only: skip draining the summary, commit still surfaces any error of the query
+        await tx.run(cypher, **params)
 
     async def _work_transaction_async(self, tx: Any, cypher: LiteralString, **params: Any) -> List[dict[str, Any]]:
         result: AsyncResult = await tx.run(cypher, **params)
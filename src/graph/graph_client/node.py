@@ -7,7 +7,8 @@ managing node data.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Iterable, Mapping, Tuple, Union
+from itertools import chain
+from typing import Any, Dict, List, Iterable, Mapping, Sequence, Tuple, Union
 
 @dataclass(frozen=False)
 class Node:
@@ -63,7 +64,14 @@ class Node:
         Returns:
             - Node: A new Node instance with the combined labels.
         """
-        return Node(labels=list(dict.fromkeys([*self.labels, *extra])), properties=dict(self.properties))
+        ## single pass over both label sources, first occurrence wins
+        seen: set[str] = set()
+        labels: List[str] = []
+        for label in chain(self.labels, extra):
+            if label not in seen:
+                seen.add(label)
+                labels.append(label)
+        return Node(labels=labels, properties=dict(self.properties))
     
     def with_props(self, **extra: Any) -> "Node":
         """_summary_
@@ -161,7 +169,7 @@ class Relationship:
         self.properties = properties if properties is not None else {}
 
     @classmethod
-    def from_any(x: Any) -> "Relationship":
+    def from_any(cls, x: Any) -> "Relationship":
         """_summary_
         Creates a Relationship instance from various input types.
 
@@ -174,17 +182,17 @@ class Relationship:
         Raises:
             - ValueError: If the input cannot be converted to a Relationship.
         """
-        if isinstance(x, Relationship):
+        if isinstance(x, cls):
             return x
         if isinstance(x, Mapping):
-            try:
-                start = x["start"]
-                end = x["end"]
-                type_ = x["type"]
-                properties = x.get("properties", {})
-                return Relationship(start=start, end=end, type=type_, properties=properties)
-            except KeyError as e:
-                raise ValueError(f"Missing key in mapping: {e}")
+            ## one lookup per key, a missing key reads as None
+            start = x.get("start")
+            end = x.get("end")
+            type_ = x.get("type")
+            if start is None or end is None or type_ is None:
+                missing = [key for key, value in (("start", start), ("end", end), ("type", type_)) if value is None]
+                raise ValueError(f"Missing key in mapping: {missing}")
+            return cls(start=start, end=end, type=type_, properties=x.get("properties", {}))
         raise ValueError("Cannot convert to Relationship.")
     
     def with_props(self, **extra: Any) -> "Relationship":
@@ -268,7 +276,13 @@ class NodeExtension:
         """
         if isinstance(obj, Node):
             return True
-        return hasattr(obj, "labels") and hasattr(obj, "properties")
+        ## one try block instead of a hasattr call per attribute
+        try:
+            obj.labels
+            obj.properties
+        except AttributeError:
+            return False
+        return True
     
     @staticmethod
     def is_relationship(obj: Any) -> bool:
@@ -277,12 +291,14 @@ class NodeExtension:
         """
         if isinstance(obj, Relationship):
             return True
-        return (
-            hasattr(obj, "start") and
-            hasattr(obj, "end") and
-            hasattr(obj, "type") and
-            hasattr(obj, "properties")
-        )
+        try:
+            obj.start
+            obj.end
+            obj.type
+            obj.properties
+        except AttributeError:
+            return False
+        return True
     
     @staticmethod
     def dict_to_node(labels: List[str], data: dict[str, Any]) -> Node:
@@ -332,6 +348,23 @@ class NodeExtension:
                 return labels, properties
         raise ValueError("Cannot extract node data.")
     
+    @staticmethod
+    def extract_node_view(obj: Node | Mapping[str, Any]) -> Tuple[Sequence[str], Mapping[str, Any]]:
+        """_summary_
+        Extracts labels and properties from a Node or mapping without copying them.
+        The returned labels and properties are the node's own objects and must be treated as read-only,
+        use `extract_node` when the caller mutates them.
+
+        Args:
+            - node (Node | Mapping[str, Any]): The node to extract from.
+
+        Returns:
+            - Tuple[Sequence[str], Mapping[str, Any]]: A tuple containing the labels and properties.
+        """
+        if isinstance(obj, Node):
+            return obj.labels, obj.properties
+        return NodeExtension.extract_node(obj)
+
     @staticmethod
     def pick_id(props: Dict[str, Any], primary_key: Union[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """_summary_
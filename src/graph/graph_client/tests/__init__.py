@@ -0,0 +1,6 @@
+# __init__.py
+
+__all__ = [
+    "TestGraphClientSessionPool",
+    "TestGraphClientBatchedMerge",
+]
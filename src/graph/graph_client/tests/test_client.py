@@ -0,0 +1,157 @@
+"""_summary
+This module is for unit tests for the session pool and the batched merges of the GraphClient.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+from pydantic import SecretStr
+from graph.graph_client.client import GraphClient
+from graph.graph_client.node import Node, Relationship
+
+
+class FakeTransaction:
+    """Stands in for an AsyncManagedTransaction, records the queries it runs."""
+
+    def __init__(self, queries: list):
+        self.queries = queries
+
+    async def run(self, cypher: str, **params):
+        self.queries.append((cypher, params))
+
+
+class FakeSession:
+    """Stands in for an AsyncSession, records whether it was closed and the queries it ran."""
+
+    def __init__(self):
+        self.closed = False
+        self.queries = []
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(FakeTransaction(self.queries), *args, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeDriver:
+    """Stands in for an AsyncDriver, hands out FakeSessions."""
+
+    def __init__(self):
+        self.sessions = []
+
+    def session(self, database: str):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+    async def close(self):
+        pass
+
+
+def make_client(pool_size: int, **kwargs) -> tuple[GraphClient, FakeDriver]:
+    driver = FakeDriver()
+    with mock.patch("graph.graph_client.client.AsyncGraphDatabase.driver", return_value=driver):
+        client = GraphClient(
+            mock.Mock(), "bolt://localhost:7687", "neo4j", SecretStr("password"),
+            max_connection_pool_size=pool_size,
+            **kwargs,
+        )
+    return client, driver
+
+
+class TestGraphClientSessionPool(unittest.TestCase):
+    """Unit tests for GraphClient._session."""
+
+    def test_reuses_released_session(self):
+        """Test that a released session is handed to the next caller."""
+        async def run():
+            client, driver = make_client(1)
+            async with client._session() as first:
+                pass
+            async with client._session() as second:
+                pass
+            self.assertIs(first, second)
+            self.assertEqual(len(driver.sessions), 1)
+        asyncio.run(run())
+
+    def test_failed_session_wakes_waiter(self):
+        """Test that a caller waiting for a session gets one when the borrowed session raises."""
+        async def run():
+            client, driver = make_client(1)
+            entered = asyncio.Event()
+
+            async def failing():
+                async with client._session():
+                    entered.set()
+                    await asyncio.sleep(0)
+                    raise RuntimeError("broken connection")
+
+            async def waiting():
+                await entered.wait()
+                async with client._session() as session:
+                    return session
+
+            results = await asyncio.wait_for(
+                asyncio.gather(failing(), waiting(), return_exceptions=True), timeout=1
+            )
+            self.assertIsInstance(results[0], RuntimeError)
+            self.assertIsInstance(results[1], FakeSession)
+            self.assertTrue(driver.sessions[0].closed)
+            self.assertIsNot(results[1], driver.sessions[0])
+        asyncio.run(run())
+
+    def test_bounded_by_pool_size(self):
+        """Test that no more sessions than the pool size are borrowed at a time."""
+        async def run():
+            client, driver = make_client(2)
+            borrowed = 0
+            peak = 0
+
+            async def borrow():
+                nonlocal borrowed, peak
+                async with client._session():
+                    borrowed += 1
+                    peak = max(peak, borrowed)
+                    await asyncio.sleep(0)
+                    borrowed -= 1
+
+            await asyncio.gather(*(borrow() for _ in range(6)))
+            self.assertEqual(peak, 2)
+            self.assertEqual(len(driver.sessions), 2)
+        asyncio.run(run())
+
+
+class TestGraphClientBatchedMerge(unittest.TestCase):
+    """Unit tests for the batched node and relationship merges of GraphClient."""
+
+    def test_repeated_node_merge_sends_properties(self):
+        """Test that merging the same node twice sends its properties both times."""
+        async def run():
+            client, driver = make_client(1, primary_keys={"FILE": "artifact"})
+            node = Node(labels=["FILE"], properties={"artifact": "a@FILE", "image": "x"})
+            await client.merge_nodes([node], "FILE", "artifact")
+            await client.merge_nodes([node], "FILE", "artifact")
+            queries = driver.sessions[0].queries
+            self.assertEqual(len(queries), 2)
+            for cypher, params in queries:
+                self.assertIn("MERGE", cypher)
+                self.assertEqual(params["rows"], [{"pk": "a@FILE", "props": node.properties}])
+        asyncio.run(run())
+
+    def test_relation_endpoints_are_merged(self):
+        """Test that relationships MERGE their start/end nodes with their properties."""
+        async def run():
+            client, driver = make_client(1, primary_keys={"FILE": "artifact", "PROCESS": "artifact"})
+            start = Node(labels=["PROCESS"], properties={"artifact": "p@PROCESS"})
+            end = Node(labels=["FILE"], properties={"artifact": "a@FILE"})
+            rel = Relationship(start=start, type="READ", end=end, properties={"weight": 1})
+            await client.create_relations([rel])
+            await client.create_relations([rel])
+            for cypher, params in driver.sessions[0].queries:
+                self.assertNotIn("MATCH", cypher)
+                self.assertIn("SET s += row.sprops", cypher)
+                self.assertIn("SET e += row.eprops", cypher)
+                self.assertEqual(params["rows"][0]["sprops"], start.properties)
+                self.assertEqual(params["rows"][0]["eprops"], end.properties)
+        asyncio.run(run())
@@ -1,23 +1,109 @@
 """_summary_
 This module defines the elements for the syscall graph data structure.
 """
-from datetime import datetime
+import asyncio
+import csv
+import os
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from pydantic import BaseModel
 from neo4j.time import DateTime
-from typing import Optional, List
+from typing import Any, Awaitable, Dict, Iterable, Iterator, Optional, List, Tuple
 from uuid import UUID
-from graph.provenance.type import Artifact, ActionType, ActorType
+from weakref import WeakValueDictionary
+from graph.provenance.type import Artifact, ActionType, ActorType, ArtifactType
 from graph.graph_element.exceptions import InvalidElementException
 from graph.graph_client.node import Node, Relationship, NodeExtension
+from graph.graph_client.client import GraphClient
+
+## graph elements shared by every SigraphNode/SigraphRelationship with the same content,
+## an entry lives as long as some element still references it
+_GRAPH_NODE_CACHE: "WeakValueDictionary[Tuple[Any, ...], Node]" = WeakValueDictionary()
+_GRAPH_RELATIONSHIP_CACHE: "WeakValueDictionary[Tuple[Any, ...], Relationship]" = WeakValueDictionary()
+## shared empty id tuple of SigraphNodes without related spans/traces
+_EMPTY: Tuple[str, ...] = ()
+## interned SigraphNodes per (artifact type, artifact), see SigraphNode.get_or_create
+_NODE_CACHE: "WeakValueDictionary[Tuple[str, str], SigraphNode]" = WeakValueDictionary()
+## the most recently used interned SigraphNodes without related spans/traces are kept alive here (LRU),
+## so an artifact repeated across batches is not rebuilt once the previous batch is released.
+## nodes with ids are not pinned: upsert adds a new span/trace id per event, so their content rarely repeats
+_NODE_POOL: "OrderedDict[Tuple[str, str], SigraphNode]" = OrderedDict()
+_NODE_POOL_SIZE: int = 100_000
+
+## interned label / relationship type strings per enum member, looked up instead of reading .value
+_LABEL_STR: dict[ArtifactType, str] = {t: sys.intern(str(t.value)) for t in ArtifactType}
+_ACTION_STR: dict[ActionType, str] = {t: sys.intern(str(t.value)) for t in ActionType}
+## shared label tuple per artifact type, every SigraphNode of a type references the same tuple
+_LABELS: dict[ArtifactType, Tuple[str, ...]] = {t: (_LABEL_STR[t],) for t in ArtifactType}
+
+## labels of the trace / sigma rule nodes, immutable and shared by every instance
+_TRACE_LABELS: Tuple[str, ...] = ("Trace",)
+_RULE_LABELS: Tuple[str, ...] = ("SigmaRule",)
+
+
+def from_neo_time(value: DateTime) -> datetime:
+    """_summary_
+    Convert a neo4j DateTime to a naive UTC datetime, without a round trip through float seconds.
+    A DateTime without timezone is returned as it is stored.
+
+    Args:
+        value (DateTime): The neo4j DateTime.
+
+    Returns:
+        datetime: The naive datetime, in UTC when the DateTime has a timezone.
+    """
+    native: datetime = value.to_native()
+    if native.tzinfo is not None:
+        native = native.astimezone(timezone.utc).replace(tzinfo=None)
+    return native
+
+
+## direction of a SigraphRelationship per actor type: True when it points from the action node to the process node
+_REL_REVERSED: dict[ActorType, bool] = {
+    ActorType.READ_RECV: True,
+    ActorType.WRITE_SEND: False,
+    ActorType.NOT_ACTOR: False,
+}
+
+## while set, elements do not keep their built Node/Relationship (see bulk_mode)
+_BULK: ContextVar[bool] = ContextVar("sigraph_bulk_mode", default=False)
+
+
+@contextmanager
+def bulk_mode() -> Iterator[None]:
+    """_summary_
+    Within this context, SigraphNode/SigraphRelationship do not store their built
+    Node/Relationship on the instance, so a large ingestion does not retain one per element.
+    Built elements are still shared through the weak content caches while in use.
+    """
+    token = _BULK.set(True)
+    try:
+        yield
+    finally:
+        _BULK.reset(token)
+
+
+async def _gather_bounded(writes: Iterable[Awaitable[None]], concurrency: int) -> None:
+    """_summary_
+    Run batched writes concurrently, at most `concurrency` of them in flight,
+    so that they use several pooled sessions instead of one after another.
+    """
+    sema = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _bounded(write: Awaitable[None]) -> None:
+        async with sema:
+            await write
+
+    await asyncio.gather(*(_bounded(write) for write in writes))
+
 
 class SigraphNode:
     """_summary_
     Represents a node in the system provenance graph.
 
-    Args:
-        BaseModel (_type_):
-        BaseModel is a Pydantic model that provides data validation and serialization.
-
     Attributes:
         unit_id (UUID): Unique identifier for the node.
         artifact (Artifact): The artifact associated with the node.
@@ -27,88 +113,286 @@ class SigraphNode:
     Each node has a unique id to distinguish user environment, an associated artifact, and optional parent artifacts.
     """
 
-    __labels: List[str]
+    ## no per-instance __dict__, graphs hold one SigraphNode per artifact occurrence
+    __slots__ = (
+        "__labels",
+        "__artifact",
+        "__artifact_str",
+        "__process_name",
+        "__related_span_ids",
+        "__related_trace_ids",
+        "__graph_node",
+        "__weakref__",
+    )
+
+    __labels: Tuple[str, ...]
     __artifact: Artifact
+    __artifact_str: str
     __process_name: Optional[str]
-    __related_span_ids: Optional[List[str]]
-    __related_trace_ids: Optional[List[str]]
+    __related_span_ids: Tuple[str, ...]
+    __related_trace_ids: Tuple[str, ...]
     __graph_node: Node
 
     def __init__(self,
                  artifact: Artifact,
                  process_name: Optional[str] = None,
-                 related_span_ids: Optional[List[str]] = None,
-                 related_trace_ids: Optional[List[str]] = None):
+                 related_span_ids: Optional[Iterable[str]] = None,
+                 related_trace_ids: Optional[Iterable[str]] = None):
 
         self.__artifact = artifact
-        self.__labels = [str(artifact.artifact_type.value)]
+        ## formatted once, used by the MERGE key, hashing and the node properties
+        self.__artifact_str = str(artifact)
+        self.__labels = _LABELS[artifact.artifact_type]
         self.__process_name = process_name
-        self.__related_span_ids = related_span_ids
-        self.__related_trace_ids = related_trace_ids
+        ## immutable, so built nodes and interned SigraphNodes can share them
+        self.__related_span_ids = tuple(related_span_ids) if related_span_ids else _EMPTY
+        self.__related_trace_ids = tuple(related_trace_ids) if related_trace_ids else _EMPTY
         self.__graph_node = None
 
+    @classmethod
+    def get_or_create(cls,
+                      artifact: Artifact,
+                      process_name: Optional[str] = None,
+                      related_span_ids: Optional[Iterable[str]] = None,
+                      related_trace_ids: Optional[Iterable[str]] = None) -> "SigraphNode":
+        """_summary_
+        Get the interned SigraphNode of the artifact, or create and intern a new one.
+        The interned node is returned only when its content matches the arguments,
+        otherwise the new node replaces it.
+        The last _NODE_POOL_SIZE interned nodes without related span/trace ids (e.g. parent
+        process nodes) stay alive even when no caller references them. Nodes with ids are only
+        shared while some caller still references them, they rarely repeat across events.
+
+        Args:
+            artifact (Artifact): The artifact of the node.
+            process_name (Optional[str]): The process name of the node.
+            related_span_ids (Optional[Iterable[str]]): The related span ids of the node.
+            related_trace_ids (Optional[Iterable[str]]): The related trace ids of the node.
+
+        Returns:
+            SigraphNode: The interned SigraphNode.
+        """
+        key = (_LABEL_STR[artifact.artifact_type], str(artifact))
+        span_ids = tuple(related_span_ids) if related_span_ids else _EMPTY
+        trace_ids = tuple(related_trace_ids) if related_trace_ids else _EMPTY
+        pooled = not span_ids and not trace_ids
+        if pooled:
+            node = _NODE_POOL.get(key)
+            if node is not None and node.__process_name == process_name:
+                _NODE_POOL.move_to_end(key)
+                return node
+        node = _NODE_CACHE.get(key)
+        if node is not None and \
+            node.__process_name == process_name and \
+            node.__related_span_ids == span_ids and \
+            node.__related_trace_ids == trace_ids:
+            return node
+        node = cls(
+            artifact=artifact,
+            process_name=process_name,
+            related_span_ids=span_ids,
+            related_trace_ids=trace_ids,
+        )
+        _NODE_CACHE[key] = node
+        if pooled:
+            _NODE_POOL[key] = node
+            _NODE_POOL.move_to_end(key)
+            if len(_NODE_POOL) > _NODE_POOL_SIZE:
+                _NODE_POOL.popitem(last=False)
+        return node
+
+    def __eq__(self, other: object) -> bool:
+        ## a graph node is identified by its label and artifact (the MERGE key)
+        if not isinstance(other, SigraphNode):
+            return NotImplemented
+        return self.__labels[0] == other.__labels[0] and self.__artifact_str == other.__artifact_str
+
+    def __hash__(self) -> int:
+        return hash((self.__labels[0], self.__artifact_str))
+
     @property
     def artifact(self) -> Artifact:
         """Get the artifact associated with the node"""
         return self.__artifact
     
     @property
-    def related_span_ids(self) -> Optional[List[str]]:
+    def node_id(self) -> str:
+        """_summary_
+        Get the formatted artifact, the MERGE key and import id of the node.
+        Relationships are still written with their full start/end nodes, so GraphClient
+        MERGEs the endpoints instead of matching them by this id.
+        """
+        return self.__artifact_str
+
+    @property
+    def related_span_ids(self) -> Tuple[str, ...]:
         """Get the related span ids associated with the node"""
-        return self.__related_span_ids if self.__related_span_ids else []
+        return self.__related_span_ids
     
     @property
-    def related_trace_ids(self) -> Optional[List[str]]:
+    def related_trace_ids(self) -> Tuple[str, ...]:
         """Get the related trace ids associated with the node"""
-        return self.__related_trace_ids if self.__related_trace_ids else []
+        return self.__related_trace_ids
 
     @property
     def image(self) -> Optional[str]:
         """Get the process name associated with the node"""
         return self.__process_name
 
+    def cache_key(self) -> Tuple[Any, ...]:
+        """_summary_
+        Key identifying the content of the graph node, shared by equal SigraphNodes.
+        """
+        ## read the slots directly, the property getters are for callers
+        return (
+            self.__labels,
+            self.__artifact_str,
+            self.__process_name,
+            self.__related_span_ids,
+            self.__related_trace_ids,
+        )
+
     def to_node(self) -> Node:
         """_summary
-        Convert the SigraphNode instance to a py2neo Node object.
+        Convert the SigraphNode instance to a graph Node object.
         This method creates a Node object with essential properties and returns it.
+        The Node is shared with other SigraphNodes of the same content.
         Returns:
-            Node: The created py2neo Node object.
+            Node: The created graph Node object.
         """
         ## Check if the node has already been created
         if self.__graph_node is not None:
             return self.__graph_node
 
-        ## Create a py2neo Node object from the SigraphNode instance with essential properties.
-        current: Node = Node(
-            labels=self.__labels,
-            properties={
-                "artifact": str(self.artifact),
-            }
+        key = self.cache_key()
+        cached = _GRAPH_NODE_CACHE.get(key)
+        if cached is not None:
+            if not _BULK.get():
+                self.__graph_node = cached
+            return cached
+
+        ## Create a graph Node object from the SigraphNode instance with essential properties.
+        ## the label tuple is shared, the Node gets its own list
+        current: Node = Node(labels=list(self.__labels), properties=self.to_props())
+
+        ## Store the created node in the instance variable
+        if not _BULK.get():
+            self.__graph_node = current
+        _GRAPH_NODE_CACHE[key] = current
+        return current
+
+    def label(self) -> str:
+        """_summary_
+        Get the primary label of the node, the value of its artifact type.
+        """
+        return self.__labels[0]
+
+    def to_props(self) -> dict[str, Any]:
+        """_summary_
+        Build the properties of the graph node as a plain dict, without creating a Node.
+        Optional properties are only present when they are set.
+
+        Returns:
+            dict[str, Any]: The node properties.
+        """
+        props: dict[str, Any] = {"artifact": self.__artifact_str}
+        if self.__process_name:
+            props["image"] = self.__process_name
+        if self.__related_span_ids:
+            props["related_span_ids"] = self.__related_span_ids
+        if self.__related_trace_ids:
+            props["related_trace_ids"] = self.__related_trace_ids
+        return props
+
+    ## columns of the neo4j-admin import node file, the ID column is stored as the artifact property
+    CSV_HEADER: Tuple[str, ...] = ("artifact:ID", "image", "related_span_ids:string[]", "related_trace_ids:string[]", ":LABEL")
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphNode instance to a row of a neo4j-admin import node file (see CSV_HEADER).
+        Arrays use the default ';' array delimiter of neo4j-admin.
+
+        Returns:
+            Tuple[str, ...]: The row values.
+        """
+        return (
+            self.__artifact_str,
+            self.__process_name or "",
+            ";".join(self.__related_span_ids),
+            ";".join(self.__related_trace_ids),
+            self.__labels[0],
         )
 
-        ## add additional properties to the node
-        if self.image:
-            current["image"] = self.image
+    def to_row(self) -> dict[str, Any]:
+        """_summary_
+        Convert the SigraphNode instance to a plain row, the labels next to the properties.
+        This is the mapping shape NodeExtension.extract_node reads, so GraphClient.merge_nodes accepts it.
+        Reuses the Node when it is already built, and does not build one otherwise.
 
-        if self.related_span_ids:
-            current["related_span_ids"] = self.related_span_ids
+        Returns:
+            dict[str, Any]: {"labels": [...], "artifact": ..., ...}
+        """
+        if self.__graph_node is not None:
+            return {"labels": self.__graph_node.labels, **self.__graph_node.properties}
+        return {"labels": list(self.__labels), **self.to_props()}
 
-        if self.related_trace_ids:
-            current["related_trace_ids"] = self.related_trace_ids
+    @classmethod
+    def bulk_to_rows(cls, items: Iterable["SigraphNode"]) -> List[dict[str, Any]]:
+        """_summary_
+        Convert SigraphNodes to plain rows in one pass, without building
+        Node objects for the ones that are not built yet.
 
-        ## Store the created node in the instance variable
-        self.__graph_node = current
-        return current
+        Args:
+            items (Iterable[SigraphNode]): The nodes to convert.
+
+        Returns:
+            List[dict[str, Any]]: One row per node, see to_row.
+        """
+        return [item.to_row() for item in items]
+
+    @classmethod
+    async def bulk_write(cls,
+                         graph_client: GraphClient,
+                         items: List["SigraphNode"],
+                         batch_size: int = 1000,
+                         concurrency: int = 8) -> None:
+        """_summary_
+        Merge SigraphNodes with one UNWIND query per artifact type and batch,
+        instead of one round trip per node.
+        Equal nodes (same label and artifact) are sent once, with their properties
+        combined in order, the same result as merging them one by one.
+
+        Args:
+            graph_client (GraphClient): The graph client to write with.
+            items (List[SigraphNode]): The nodes to merge.
+            batch_size (int): Number of nodes per write transaction.
+            concurrency (int): Maximum number of batches written at the same time.
+        """
+        unique: dict[SigraphNode, dict[str, Any]] = {}
+        for item in items:
+            row = item.to_row()
+            prev = unique.get(item)
+            if prev is not None:
+                ## SET n += props of every duplicate, later values win
+                row = {**prev, **row}
+            unique[item] = row
+        buckets: dict[str, List[dict[str, Any]]] = {}
+        for item, row in unique.items():
+            buckets.setdefault(item.label(), []).append(row)
+        await _gather_bounded(
+            (
+                graph_client.merge_nodes(rows[i:i + batch_size], label, "artifact")
+                for label, rows in buckets.items()
+                for i in range(0, len(rows), batch_size)
+            ),
+            concurrency,
+        )
 
 
 class SigraphRelationship:
     """_summary_
     Represents a relationship in the system provenance graph.
 
-    Args:
-        BaseModel (_type_):
-        BaseModel is a Pydantic model that provides data validation and serialization.
-
     Attributes:
         process_node (SigraphNode): The process node associated with the relationship.
         action_node (SigraphNode): The action node associated with the relationship.
@@ -119,6 +403,16 @@ class SigraphRelationship:
     the relationship before and after the actor_node, and the name of the relationship change.
     """
 
+    __slots__ = (
+        "__process_node",
+        "__action_node",
+        "__action_type",
+        "__actor_type",
+        "__start_time",
+        "__weight",
+        "__graph_relationship",
+    )
+
     __process_node: SigraphNode
     __action_node: SigraphNode
     __action_type: ActionType
@@ -144,6 +438,18 @@ class SigraphRelationship:
         self.__weight = weight
         self.__graph_relationship = None
 
+    def __eq__(self, other: object) -> bool:
+        ## a graph relationship is identified by its end nodes and type
+        if not isinstance(other, SigraphRelationship):
+            return NotImplemented
+        return self.__process_node == other.__process_node and \
+            self.__action_node == other.__action_node and \
+            self.__action_type == other.__action_type and \
+            self.__actor_type == other.__actor_type
+
+    def __hash__(self) -> int:
+        return hash((self.__process_node, self.__action_node, self.__action_type, self.__actor_type))
+
     @property
     def process_node(self) -> SigraphNode:
         """Get the process node associated with the relationship"""
@@ -176,64 +482,141 @@ class SigraphRelationship:
 
     def to_relationship(self) -> Relationship:
         """_summary_
-        Convert the SigraphRelationship instance to a py2neo Relationship object.
+        Convert the SigraphRelationship instance to a graph Relationship object.
         This method creates a relationship based on the actor type and returns it.
 
         Raises:
             InvalidElementException: If the actor type is invalid.
             Returns:
-                Relationship: The created py2neo Relationship object.
+                Relationship: The created graph Relationship object.
         """
 
         ## Check if the relationship has already been created
         if self.__graph_relationship is not None:
             return self.__graph_relationship
 
-        if self.actor_type == ActorType.READ_RECV:
-            rel: Relationship = Relationship(
-                start=self.__action_node.to_node(),
-                type=str(self.action_type.value),
-                end=self.__process_node.to_node(),
-                properties={
-                    "start_time": self.start_time,
-                    "weight": self.weight,
-                }
-            )
-        elif self.actor_type == ActorType.WRITE_SEND:
-            rel: Relationship = Relationship(
-                start=self.__process_node.to_node(),
-                type=str(self.action_type.value),
-                end=self.__action_node.to_node(),
-                properties={
-                    "start_time": self.start_time,
-                    "weight": self.weight,
-                }
-            )
-        elif self.actor_type == ActorType.NOT_ACTOR:
-            rel: Relationship = Relationship(
-                start=self.__process_node.to_node(),
-                type=str(self.action_type.value),
-                end=self.__action_node.to_node(),
-                properties={
-                    "start_time": self.start_time,
-                    "weight": self.weight,
-                }
-            )
-        else:
-            raise InvalidElementException(
-                message=f"Invalid actor type: {self.actor_type}",
-                element=(str(self.process_node.artifact), str(self.action_node.artifact))
-            )
+        key = (
+            self.__process_node.cache_key(),
+            self.__action_node.cache_key(),
+            self.__action_type,
+            self.__actor_type,
+            self.__start_time,
+            self.__weight,
+        )
+        cached = _GRAPH_RELATIONSHIP_CACHE.get(key)
+        if cached is not None:
+            if not _BULK.get():
+                self.__graph_relationship = cached
+            return cached
+
+        start_node, end_node = self.__endpoints()
+
+        rel: Relationship = Relationship(
+            start=start_node.to_node(),
+            type=_ACTION_STR[self.__action_type],
+            end=end_node.to_node(),
+            properties={
+                "start_time": self.__start_time,
+                "weight": self.__weight,
+            }
+        )
         
         ## Store the created relationship in the instance variable
-        self.__graph_relationship = rel
+        if not _BULK.get():
+            self.__graph_relationship = rel
+        _GRAPH_RELATIONSHIP_CACHE[key] = rel
         return rel
+
+    def __endpoints(self) -> Tuple[SigraphNode, SigraphNode]:
+        """_summary_
+        Resolve the (start, end) nodes of the relationship from the actor type with one table lookup.
+
+        Raises:
+            InvalidElementException: If the actor type is invalid.
+        """
+        reversed_ = _REL_REVERSED.get(self.__actor_type)
+        if reversed_ is None:
+            raise InvalidElementException(
+                message=f"Invalid actor type: {self.actor_type}",
+                element=(self.__process_node.node_id, self.__action_node.node_id)
+            )
+        if reversed_:
+            return self.__action_node, self.__process_node
+        return self.__process_node, self.__action_node
+
+    ## columns of the neo4j-admin import relationship file, the ids are the artifacts of the end nodes
+    CSV_HEADER: Tuple[str, ...] = (":START_ID", ":END_ID", ":TYPE", "start_time:datetime", "weight:int")
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphRelationship instance to a row of a neo4j-admin import relationship file
+        (see CSV_HEADER), with the same direction as to_relationship.
+
+        Raises:
+            InvalidElementException: If the actor type is invalid.
+
+        Returns:
+            Tuple[str, ...]: The row values.
+        """
+        start_node, end_node = self.__endpoints()
+        return (
+            start_node.node_id,
+            end_node.node_id,
+            _ACTION_STR[self.__action_type],
+            self.__start_time.isoformat(),
+            str(self.__weight),
+        )
+
+    @classmethod
+    async def bulk_write(cls,
+                         graph_client: GraphClient,
+                         items: List["SigraphRelationship"],
+                         batch_size: int = 1000,
+                         concurrency: int = 8) -> None:
+        """_summary_
+        Merge SigraphRelationships and their end nodes in batches.
+        GraphClient groups every batch by (start label, end label, type) into one UNWIND query each,
+        and the direction of every relationship is already resolved by to_relationship.
+        A relationship repeated between the same built nodes is sent once, the last one wins
+        as it would with one SET r += props per duplicate.
+
+        Args:
+            graph_client (GraphClient): The graph client to write with.
+            items (List[SigraphRelationship]): The relationships to merge.
+            batch_size (int): Number of relationships per write transaction.
+            concurrency (int): Maximum number of batches written at the same time.
+        """
+        unique: dict[Tuple[int, int, str], Relationship] = {}
+        with bulk_mode():
+            for item in items:
+                rel = item.to_relationship()
+                ## built nodes are shared per content, so identity means same endpoints and props
+                key = (id(rel.start), id(rel.end), rel.type)
+                unique.pop(key, None)
+                unique[key] = rel
+        rels: List[Relationship] = list(unique.values())
+        await _gather_bounded(
+            (graph_client.create_relations(rels[i:i + batch_size]) for i in range(0, len(rels), batch_size)),
+            concurrency,
+        )
     
 class SigraphTrace:
-    __labels: list[str] = ["Trace"]
+    __slots__ = (
+        "__trace_id",
+        "__unit_id",
+        "__unit_id_str",
+        "__start_time",
+        "__neo_time",
+        "__representative_process_name",
+        "__span_count",
+        "__graph_node",
+    )
+
     __trace_id: str
     __unit_id: UUID
+    __unit_id_str: str
     __start_time: datetime
+    __neo_time: Optional[DateTime]
     __representative_process_name: Optional[str]
     __span_count: Optional[int]
     __graph_node: Node
@@ -247,7 +630,10 @@ class SigraphTrace:
                  ):
         self.__trace_id = trace_id
         self.__unit_id = unit_id
+        ## formatted once, unit_id never changes
+        self.__unit_id_str = str(unit_id)
         self.__start_time = start_time
+        self.__neo_time = None
         self.__representative_process_name = representative_process_name
         self.__span_count = span_count
         self.__graph_node = None
@@ -266,15 +652,23 @@ class SigraphTrace:
     
     @property
     def neo_time(self) -> DateTime:
-        return DateTime.from_native(self.__start_time)
+        ## converted on first access, the start_time setters drop it
+        if self.__neo_time is None:
+            self.__neo_time = DateTime.from_native(self.__start_time)
+        return self.__neo_time
 
     @start_time.setter
     def start_time(self, value: datetime):
         self.__start_time = value
+        self.__neo_time = None
+        self.__graph_node = None
 
     @neo_time.setter
     def neo_time(self, value: DateTime):
-        self.__start_time = datetime.fromtimestamp(value.to_native().timestamp())
+        ## the same conversion as traces read back by from_graph_trace_node_to_sigraph
+        self.__start_time = from_neo_time(value)
+        self.__neo_time = value
+        self.__graph_node = None
 
     @property
     def representative_process_name(self) -> Optional[str]:
@@ -283,6 +677,7 @@ class SigraphTrace:
     @representative_process_name.setter
     def representative_process_name(self, value: Optional[str]):
         self.__representative_process_name = value
+        self.__graph_node = None
 
     @property
     def span_count(self) -> Optional[int]:
@@ -291,36 +686,53 @@ class SigraphTrace:
     @span_count.setter
     def span_count(self, value: Optional[int]):
         self.__span_count = value
+        self.__graph_node = None
 
     
+    ## columns of the neo4j-admin import node file, trace ids have their own id space
+    CSV_HEADER: Tuple[str, ...] = (
+        "trace_id:ID(Trace)", "unit_id", "start_time:datetime",
+        "representative_process_name", "span_count:int", ":LABEL",
+    )
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphTrace instance to a row of a neo4j-admin import node file (see CSV_HEADER).
+        Unset optional values are written empty, which the import reads as no property.
+        """
+        return (
+            self.__trace_id,
+            self.__unit_id_str,
+            self.__start_time.isoformat() if self.__start_time else "",
+            self.__representative_process_name or "",
+            str(self.__span_count) if self.__span_count is not None else "",
+            _TRACE_LABELS[0],
+        )
+
     def to_node(self) -> Node:
         """_summary_
-        Convert the SigraphTrace instance to a py2neo Node object.
+        Convert the SigraphTrace instance to a graph Node object.
         This method creates a Node object with essential properties and returns it.
         Returns:
-            Node: The created py2neo Node object.
+            Node: The created graph Node object.
         """
-        ## Check if the node has already been created
+        ## Check if the node has already been created, the setters drop it on updates
         if self.__graph_node is not None:
-            ## check for node updates
-            if (self.__graph_node.get("span_count") == self.__span_count) and \
-                (self.__graph_node.get("start_time") == self.__start_time) and \
-                (self.__graph_node.get("representative_process_name") == self.__representative_process_name):
-                return self.__graph_node
-
-        ## Create a py2neo Node object from the SigraphTraceDocument instance with essential properties.
-        current: Node = Node(labels=self.__labels,
-                             properties={
-                                 "trace_id": self.trace_id,
-                                 "unit_id": str(self.unit_id)
-                             })
-        ## append additional properties to the node
+            return self.__graph_node
+
+        ## Create a graph Node object from the SigraphTraceDocument instance with essential properties.
+        props: dict[str, Any] = {
+            "trace_id": self.__trace_id,
+            "unit_id": self.__unit_id_str
+        }
+        ## append additional properties before building the node
         if self.__start_time:
-            current["start_time"] = self.__start_time
+            props["start_time"] = self.__start_time
         if self.__representative_process_name:
-            current["representative_process_name"] = self.__representative_process_name
+            props["representative_process_name"] = self.__representative_process_name
         if self.__span_count is not None:
-            current["span_count"] = self.__span_count
+            props["span_count"] = self.__span_count
+        current: Node = Node(labels=list(_TRACE_LABELS), properties=props)
         
         ## Store the created node in the instance variable
         self.__graph_node = current
@@ -329,6 +741,8 @@ class SigraphTrace:
 
 
 class SigraphTraceRelationship:
+    __slots__ = ("__trace_node", "__syscall_node", "__graph_relationship")
+
     __trace_node: SigraphTrace
     __syscall_node: SigraphNode
     __relation_name: str = "CONTAINS"
@@ -353,6 +767,15 @@ class SigraphTraceRelationship:
     def relation_name(self) -> str:
         return self.__relation_name
     
+    ## columns of the neo4j-admin import relationship file, the start id is in the Trace id space
+    CSV_HEADER: Tuple[str, ...] = (":START_ID(Trace)", ":END_ID", ":TYPE")
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphTraceRelationship instance to a row of a neo4j-admin import relationship file.
+        """
+        return (self.__trace_node.trace_id, self.__syscall_node.node_id, self.__relation_name)
+
     def to_relationship(self) -> Relationship:
         if self.__graph_relationship is not None:
             return self.__graph_relationship
@@ -366,7 +789,8 @@ class SigraphTraceRelationship:
     
 
 class SigraphSigmaRule:
-    __labels: list[str] = ["SigmaRule"]
+    __slots__ = ("__rule_id", "__graph_node")
+
     __rule_id: str
     __graph_node: Node
 
@@ -379,22 +803,31 @@ class SigraphSigmaRule:
     def rule_id(self) -> str:
         return self.__rule_id
 
+    ## columns of the neo4j-admin import node file, rule ids have their own id space
+    CSV_HEADER: Tuple[str, ...] = ("rule_id:ID(SigmaRule)", ":LABEL")
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphSigmaRule instance to a row of a neo4j-admin import node file.
+        """
+        return (self.__rule_id, _RULE_LABELS[0])
+
     def to_node(self) -> Node:
         """_summary
-        Convert the SigraphSigmaRule instance to a py2neo Node object.
+        Convert the SigraphSigmaRule instance to a graph Node object.
         This method creates a Node object with essential properties and returns it.
         Returns:
-            Node: The created py2neo Node object.
+            Node: The created graph Node object.
         """
         ## Check if the node has already been created
         if self.__graph_node is not None:
             return self.__graph_node
 
-        ## Create a py2neo Node object from the SigraphSigmaRule instance with essential properties.
+        ## Create a graph Node object from the SigraphSigmaRule instance with essential properties.
         current: Node = Node(
-            labels=self.__labels,
+            labels=list(_RULE_LABELS),
             properties={
-                "rule_id": self.rule_id
+                "rule_id": self.__rule_id
             }
         )
 
@@ -404,6 +837,8 @@ class SigraphSigmaRule:
         return current
 
 class SigraphSigmaRuleRelationship:
+    __slots__ = ("__rule_node", "__syscall_node", "__graph_relationship")
+
     __rule_node: SigraphSigmaRule
     __syscall_node: SigraphNode
     __relation_name: str = "MATCHES"
@@ -428,6 +863,15 @@ class SigraphSigmaRuleRelationship:
     def relation_name(self) -> str:
         return self.__relation_name
     
+    ## columns of the neo4j-admin import relationship file, the start id is in the SigmaRule id space
+    CSV_HEADER: Tuple[str, ...] = (":START_ID(SigmaRule)", ":END_ID", ":TYPE")
+
+    def to_csv_row(self) -> Tuple[str, ...]:
+        """_summary_
+        Convert the SigraphSigmaRuleRelationship instance to a row of a neo4j-admin import relationship file.
+        """
+        return (self.__rule_node.rule_id, self.__syscall_node.node_id, self.__relation_name)
+
     def to_relationship(self) -> Relationship:
         if self.__graph_relationship is not None:
             return self.__graph_relationship
@@ -468,3 +912,85 @@ class SigraphIoC(BaseModel):
     artifact: str
     artifact_type: str
     related_trace_ids: List[str]
+
+
+def csv_bulk_export(nodes: Iterable[SigraphNode],
+                    rels: Iterable[SigraphRelationship],
+                    out_dir: str,
+                    traces: Iterable[SigraphTrace] = (),
+                    trace_rels: Iterable[SigraphTraceRelationship] = (),
+                    rules: Iterable[SigraphSigmaRule] = (),
+                    rule_rels: Iterable[SigraphSigmaRuleRelationship] = ()) -> Dict[str, List[str]]:
+    """_summary_
+    Write graph elements as neo4j-admin import files:
+    nodes_<label>.csv per artifact type, nodes_Trace.csv, nodes_SigmaRule.csv,
+    and rels_<type>.csv per relationship type (CONTAINS and MATCHES included).
+    For a cold-start load into an empty database, out of band:
+        neo4j-admin database import full <database> --nodes=<node files> --relationships=<rel files>
+    The end nodes of every relationship are exported too, and every node is written once
+    (the last occurrence wins, as the import requires unique ids).
+
+    Args:
+        nodes (Iterable[SigraphNode]): The artifact nodes to export.
+        rels (Iterable[SigraphRelationship]): The relationships between artifact nodes to export.
+        out_dir (str): The directory to write the files into, created if missing.
+        traces (Iterable[SigraphTrace]): The trace nodes to export.
+        trace_rels (Iterable[SigraphTraceRelationship]): The trace to artifact relationships to export.
+        rules (Iterable[SigraphSigmaRule]): The sigma rule nodes to export.
+        rule_rels (Iterable[SigraphSigmaRuleRelationship]): The rule to artifact relationships to export.
+
+    Returns:
+        Dict[str, List[str]]: The written file paths, {"nodes": [...], "relationships": [...]}.
+    """
+    ## node file name -> (header, id -> row), relationship file name -> (header, rows)
+    node_files: dict[str, Tuple[Tuple[str, ...], dict[str, Tuple[str, ...]]]] = {}
+    rel_files: dict[str, Tuple[Tuple[str, ...], List[Tuple[str, ...]]]] = {}
+
+    def _add_node(name: str, header: Tuple[str, ...], row: Tuple[str, ...], fill_only: bool = False) -> None:
+        ## the id column is the first one of every node header,
+        ## end nodes of relationships only fill in, explicitly given nodes take precedence
+        rows = node_files.setdefault(name, (header, {}))[1]
+        if not fill_only or row[0] not in rows:
+            rows[row[0]] = row
+
+    def _add_artifact(node: SigraphNode, fill_only: bool = False) -> None:
+        ## skip formatting the row of an end node that is already written
+        if fill_only and node.node_id in node_files.get(f"nodes_{node.label()}.csv", ((), {}))[1]:
+            return
+        _add_node(f"nodes_{node.label()}.csv", SigraphNode.CSV_HEADER, node.to_csv_row(), fill_only)
+
+    def _add_rel(header: Tuple[str, ...], row: Tuple[str, ...]) -> None:
+        ## the type column is the third one of every relationship header
+        rel_files.setdefault(f"rels_{row[2]}.csv", (header, []))[1].append(row)
+
+    for rel in rels:
+        _add_rel(SigraphRelationship.CSV_HEADER, rel.to_csv_row())
+        _add_artifact(rel.process_node, fill_only=True)
+        _add_artifact(rel.action_node, fill_only=True)
+    for trace_rel in trace_rels:
+        _add_rel(SigraphTraceRelationship.CSV_HEADER, trace_rel.to_csv_row())
+        _add_artifact(trace_rel.syscall_node, fill_only=True)
+        _add_node("nodes_Trace.csv", SigraphTrace.CSV_HEADER, trace_rel.trace_node.to_csv_row(), fill_only=True)
+    for rule_rel in rule_rels:
+        _add_rel(SigraphSigmaRuleRelationship.CSV_HEADER, rule_rel.to_csv_row())
+        _add_artifact(rule_rel.syscall_node, fill_only=True)
+        _add_node("nodes_SigmaRule.csv", SigraphSigmaRule.CSV_HEADER, rule_rel.rule_node.to_csv_row(), fill_only=True)
+    for node in nodes:
+        _add_artifact(node)
+    for trace in traces:
+        _add_node("nodes_Trace.csv", SigraphTrace.CSV_HEADER, trace.to_csv_row())
+    for rule in rules:
+        _add_node("nodes_SigmaRule.csv", SigraphSigmaRule.CSV_HEADER, rule.to_csv_row())
+
+    os.makedirs(out_dir, exist_ok=True)
+    written: Dict[str, List[str]] = {"nodes": [], "relationships": []}
+    for kind, files in (("nodes", {name: (header, list(rows.values())) for name, (header, rows) in node_files.items()}),
+                        ("relationships", rel_files)):
+        for name, (header, rows) in files.items():
+            path = os.path.join(out_dir, name)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(header)
+                writer.writerows(rows)
+            written[kind].append(path)
+    return written
@@ -1,5 +1,5 @@
 """_summary_
-This module provides extensions for graph elements, including conversion from py2neo nodes to SigraphNode
+This module provides extensions for graph elements, including conversion from graph nodes to SigraphNode
 and upserting SystemProvenance into the graph.
 """
 from datetime import datetime
@@ -7,6 +7,7 @@ from typing import Any, List, Optional, LiteralString, cast
 from uuid import UUID
 from graph.graph_element.schema import (
     CONSTRAINTS,
+    INDEXES,
     QUERY_ARTIFACT,
     QUERY_TRACES,
     QUERY_RELATED_TRACES,
@@ -29,7 +30,8 @@ from graph.graph_element.element import (
                                         SigraphTraceRelationship,
                                         SigraphSigmaRule,
                                         SigraphSigmaRuleRelationship,
-                                        SigraphSummary, SigraphIoC
+                                        SigraphSummary, SigraphIoC,
+                                        from_neo_time
                                         )
 from graph.graph_element.helper import to_prefab
 from graph.graph_client.node import Node, Relationship, NodeExtension
@@ -40,7 +42,7 @@ from graph.graph_client.client import GraphClient
 class GraphElementBehavior:
     """_summary_
     This class provides methods to handle SigraphNode instances,
-    including conversion from py2neo nodes and upserting SystemProvenance into the graph.
+    including conversion from graph nodes and upserting SystemProvenance into the graph.
     """
     
     @staticmethod
@@ -86,22 +88,22 @@ class GraphElementBehavior:
             raise InvalidInputException("Node cannot be None", ("node", type(node).__name__))
         if not "unit_id" in node or not "trace_id" in node or "start_time" not in node:
             raise InvalidElementException("Node must contain 'unit_id', 'start_time' and 'trace_id' properties", ("node", type(node).__name__))
-        ## convert timestamp string to datetime object
-        out: SigraphTrace = SigraphTrace(
+        ## convert neo4j DateTime to a naive UTC datetime once, same as the neo_time setter
+        return SigraphTrace(
             trace_id=node["trace_id"],
             unit_id=UUID(node["unit_id"]),
-            start_time=datetime.now(),
+            start_time=from_neo_time(node["start_time"]),
             representative_process_name=node.get("representative_process_name"),
             span_count=node.get("span_count"),
         )
-        ## update start_time property
-        out.neo_time = node["start_time"]
-        return out
 
     @staticmethod
     async def apply_constraints(graph_client:GraphClient):
         """_summary_
-        Apply constraints to the Neo4j graph database.
+        Apply constraints and indexes to the Neo4j graph database.
+        Every MERGE key is backed by a unique constraint (and its index),
+        so MERGE is an index lookup instead of a label scan.
+        The queries are idempotent (IF NOT EXISTS), run once at startup.
 
         Args:
             graph_client (Graph): The graph client to interact with the graph database.
@@ -110,12 +112,12 @@ class GraphElementBehavior:
             if constraint == "Artifact":
                 ## apply constraints for each ArtifactType
                 for artifact_type in ArtifactExtension.get_all_artifact_types():
-                    cypher_str = query.replace("{{$ArtifactType}}", str(artifact_type))
-                    cypher = cast(LiteralString, cypher_str)
-            elif constraint == "Trace":
-                cypher = cast(LiteralString, query)
-            # run the constraint query
-            await graph_client.run(cypher)
+                    cypher_str = query.replace("{{$ArtifactType}}", f"`{artifact_type}`")
+                    await graph_client.run(cast(LiteralString, cypher_str))
+            else:
+                await graph_client.run(cast(LiteralString, query))
+        for query in INDEXES.values():
+            await graph_client.run(cast(LiteralString, query))
     
     @staticmethod
     async def get_sigraph_node_from_graph(
@@ -322,11 +324,12 @@ class GraphElementBehavior:
                 graph_client=graph_client, artifact=actor.artifact
             )
             
+            ## the ids of a SigraphNode are immutable tuples, copy them to extend
             if exist_node and exist_node.related_span_ids:
-                related_span_ids = exist_node.related_span_ids
+                related_span_ids = list(exist_node.related_span_ids)
 
             if exist_node and exist_node.related_trace_ids:
-                related_trace_ids = exist_node.related_trace_ids
+                related_trace_ids = list(exist_node.related_trace_ids)
                 
             ## append the new related_span_id to the existing related_span_ids
             if related_span_id and related_span_id not in related_span_ids:
@@ -339,7 +342,7 @@ class GraphElementBehavior:
             if process_name is None and exist_node and exist_node.image:
                 process_name = exist_node.image
 
-            current_node: SigraphNode = SigraphNode(
+            current_node: SigraphNode = SigraphNode.get_or_create(
                 artifact=actor.artifact,
                 process_name=process_name,
                 related_span_ids=related_span_ids,
@@ -402,7 +405,7 @@ class GraphElementBehavior:
                     parent_node: SigraphNode = exist_parent_node
                 else:
                     ## if the parent node does not exist, create a new one
-                    parent_node = SigraphNode(
+                    parent_node = SigraphNode.get_or_create(
                         artifact=parent_artifact,
                     )
                     
@@ -448,36 +451,23 @@ class GraphElementBehavior:
         ## =========================================================================
         ## add node and relationship between SigraphNodes ===========================
         try:
-            ## merge the current node
-            await graph_client.merge_node(
-                sub_node=current_node.to_node(),
-                primary_label=str(current_node.artifact.artifact_type.value),
-                primary_key="artifact"
-                )
-            
-            ## merge the parent node and relationship if parent_id is provided
+            ## merge the current node and the parent node if parent_id is provided
+            sigraph_nodes: List[SigraphNode] = [current_node]
             if parent_node is not None:
-                # If parent_id is provided, merge the parent node and create a relationship
-                await graph_client.merge_node(
-                    sub_node=parent_node.to_node(),
-                    primary_label=str(parent_node.artifact.artifact_type.value),
-                    primary_key="artifact"
-                )
+                sigraph_nodes.append(parent_node)
+            await SigraphNode.bulk_write(graph_client, sigraph_nodes)
+
+            ## merge every relationship in a single write transaction
+            rels: List[Relationship] = []
             if relationship is not None:
-                # create the relationship between parent and current node
-                await graph_client.create_relation(
-                    relationship.to_relationship()
-                    )
+                # the relationship between parent and current node
+                rels.append(relationship.to_relationship())
             if parent_trace_relationship is not None:
-                # create the trace relationship between parent node and trace node
-                await graph_client.create_relation(
-                    parent_trace_relationship.to_relationship()
-                )
-
-            ## merge the trace relationship between the trace and the current node
-            await graph_client.create_relation(
-                trace_relationship.to_relationship()
-            )
+                # the trace relationship between parent node and trace node
+                rels.append(parent_trace_relationship.to_relationship())
+            ## the trace relationship between the trace and the current node
+            rels.append(trace_relationship.to_relationship())
+            await graph_client.create_relations(rels)
         except Exception as e:
             raise GraphDBInteractionException(
                 f"Failed to merge sigraph node and relationship into the graph: {e}",
@@ -590,12 +580,16 @@ class GraphElementBehavior:
                 unitId=str(unit_id),
             )
 
-            # get trace ids from the result
+            # get unique trace ids from the result
+            ## keep first-seen order in the list, use the set for membership checks
+            seen: set[str] = set()
             trace_ids: list[str] = []
             for record in result:
-                t2 = record["t2"]
-                trace_ids.append(t2["trace_id"])
-            return list(set(trace_ids))  # return unique trace ids
+                trace_id = record["t2"]["trace_id"]
+                if trace_id not in seen:
+                    seen.add(trace_id)
+                    trace_ids.append(trace_id)
+            return trace_ids
         except Exception as e:
             raise GraphDBInteractionException(
                 f"Failed to get connected trace IDs: {e}",
@@ -842,10 +836,11 @@ class GraphElementBehavior:
                 artifact_name, artifact_type = TypeExtension.from_string_to_artifact_name_and_type(artfct_str)
                 if artifact_name is None:
                     continue
-                artfct = SigraphIoC(
-                    image=ioc_record.get("image", "Unknown"),
+                ## fields are typed by construction, skip pydantic validation
+                artfct = SigraphIoC.model_construct(
+                    image=ioc_record.get("image") or "Unknown",
                     artifact=artifact_name,
-                    artifact_type=artifact_type if artifact_type is not None else "UNKNOWN",
+                    artifact_type=artifact_type.value if artifact_type is not None else "UNKNOWN",
                     related_trace_ids=list(real_ids)
                 )
                 iocs.append(artfct)
@@ -18,6 +18,16 @@ CONSTRAINTS = {
     ## Ensures that the 'trace_id' property is unique for Trace nodes.
     ## check graph_element/element.py for Trace node definition
     "Trace": "CREATE CONSTRAINT IF NOT EXISTS FOR (n:Trace) REQUIRE n.trace_id IS UNIQUE",
+    ## SigmaRule constraints.
+    ## Ensures that the 'rule_id' property is unique for SigmaRule nodes.
+    "SigmaRule": "CREATE CONSTRAINT IF NOT EXISTS FOR (n:SigmaRule) REQUIRE n.rule_id IS UNIQUE",
+}
+
+# indexes for properties that are looked up but not unique.
+## unique constraints above are backed by their own index.
+INDEXES = {
+    ## Trace nodes are filtered by unit_id in the trace, flush and IoC queries.
+    "Trace.unit_id": "CREATE INDEX trace_unit_id IF NOT EXISTS FOR (n:Trace) ON (n.unit_id)",
 }
 
 def QUERY_ARTIFACT(artifact_type: ArtifactType) -> LiteralString:
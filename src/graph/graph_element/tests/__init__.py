@@ -0,0 +1,7 @@
+# __init__.py
+
+__all__ = [
+    "TestSigraphNodeBulkWrite",
+    "TestSigraphNodeGetOrCreate",
+    "TestNeoTime",
+]
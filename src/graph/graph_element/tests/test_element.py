@@ -0,0 +1,136 @@
+"""_summary
+This module is for unit tests for the batched writes, the node pool and the time conversion of the graph elements.
+"""
+
+import asyncio
+import gc
+import unittest
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Tuple
+from uuid import uuid4
+from neo4j.time import DateTime
+from graph.provenance.type import Artifact, ArtifactType
+from graph.graph_client.node import NodeExtension
+from graph.graph_element import element
+from graph.graph_element.element import SigraphNode, SigraphTrace, from_neo_time
+
+
+class FakeGraphClient:
+    """Records merge_nodes calls and checks rows the way GraphClient.merge_nodes reads them."""
+
+    def __init__(self):
+        self.calls: List[Tuple[List[Any], str, str]] = []
+
+    async def merge_nodes(self, nodes: List[Any], primary_label: str, primary_key: str) -> None:
+        for node in nodes:
+            _, props = NodeExtension.extract_node_view(node)
+            if primary_key not in props:
+                raise ValueError(
+                    f"merge() needs property '{primary_key}' in node props. got: {list(props.keys())}"
+                )
+        self.calls.append((nodes, primary_label, primary_key))
+
+
+class TestSigraphNodeBulkWrite(unittest.TestCase):
+    """Unit tests for SigraphNode.bulk_write."""
+
+    def test_rows_are_readable_by_merge_nodes(self):
+        """Test that every row carries its labels and the primary key property."""
+        client = FakeGraphClient()
+        nodes = [
+            SigraphNode(Artifact("a", ArtifactType.FILE)),
+            SigraphNode(Artifact("p", ArtifactType.PROCESS), process_name="img"),
+        ]
+        asyncio.run(SigraphNode.bulk_write(client, nodes))
+        merged = {label: rows for rows, label, _ in client.calls}
+        self.assertEqual(set(merged), {"FILE", "PROCESS"})
+        labels, props = NodeExtension.extract_node_view(merged["PROCESS"][0])
+        self.assertEqual(list(labels), ["PROCESS"])
+        self.assertEqual(props["artifact"], "p@PROCESS")
+        self.assertEqual(props["image"], "img")
+
+    def test_duplicates_are_combined(self):
+        """Test that equal nodes are sent once with their properties combined in order."""
+        client = FakeGraphClient()
+        nodes = [
+            SigraphNode(Artifact("p", ArtifactType.PROCESS), related_span_ids=["s1"]),
+            SigraphNode(Artifact("p", ArtifactType.PROCESS), process_name="img"),
+        ]
+        asyncio.run(SigraphNode.bulk_write(client, nodes))
+        self.assertEqual(len(client.calls), 1)
+        rows = client.calls[0][0]
+        self.assertEqual(len(rows), 1)
+        _, props = NodeExtension.extract_node_view(rows[0])
+        self.assertEqual(props["image"], "img")
+        self.assertEqual(tuple(props["related_span_ids"]), ("s1",))
+
+    def test_batches(self):
+        """Test that a label is split into batches of batch_size rows."""
+        client = FakeGraphClient()
+        nodes = [SigraphNode(Artifact(str(i), ArtifactType.FILE)) for i in range(5)]
+        asyncio.run(SigraphNode.bulk_write(client, nodes, batch_size=2))
+        self.assertEqual(sorted(len(rows) for rows, _, _ in client.calls), [1, 2, 2])
+
+    def test_bulk_to_rows(self):
+        """Test that bulk_to_rows gives the same rows bulk_write sends."""
+        node = SigraphNode(Artifact("a", ArtifactType.FILE), process_name="img")
+        labels, props = NodeExtension.extract_node_view(SigraphNode.bulk_to_rows([node])[0])
+        self.assertEqual(list(labels), ["FILE"])
+        self.assertEqual(dict(props), node.to_props())
+
+
+class TestSigraphNodeGetOrCreate(unittest.TestCase):
+    """Unit tests for SigraphNode.get_or_create and the node pool."""
+
+    def setUp(self):
+        element._NODE_POOL.clear()
+
+    def test_node_without_ids_is_pooled(self):
+        """Test that a node without ids is reused once no caller references it."""
+        ref = weakref.ref(SigraphNode.get_or_create(Artifact("p", ArtifactType.PROCESS)))
+        gc.collect()
+        self.assertIsNotNone(ref())
+        self.assertIs(SigraphNode.get_or_create(Artifact("p", ArtifactType.PROCESS)), ref())
+        self.assertEqual(len(element._NODE_POOL), 1)
+
+    def test_node_with_ids_is_not_pooled(self):
+        """Test that a node with related ids is interned but not kept alive by the pool."""
+        artifact = Artifact("p", ArtifactType.PROCESS)
+        node = SigraphNode.get_or_create(artifact, related_span_ids=["s1"])
+        self.assertIs(SigraphNode.get_or_create(artifact, related_span_ids=["s1"]), node)
+        self.assertEqual(len(element._NODE_POOL), 0)
+
+    def test_pooled_node_kept_beside_node_with_ids(self):
+        """Test that a node with ids for the same artifact does not evict the pooled node."""
+        artifact = Artifact("p", ArtifactType.PROCESS)
+        pooled = SigraphNode.get_or_create(artifact)
+        with_ids = SigraphNode.get_or_create(artifact, related_span_ids=["s1"])
+        self.assertIsNot(with_ids, pooled)
+        self.assertEqual(with_ids.related_span_ids, ("s1",))
+        self.assertIs(SigraphNode.get_or_create(artifact), pooled)
+
+
+class TestNeoTime(unittest.TestCase):
+    """Unit tests for from_neo_time and SigraphTrace.neo_time."""
+
+    def test_aware_to_naive_utc(self):
+        """Test that a DateTime with a timezone becomes the same instant as a naive UTC datetime."""
+        kst = timezone(timedelta(hours=9))
+        value = DateTime.from_native(datetime(2024, 1, 1, 9, 30, 15, 123456, tzinfo=kst))
+        self.assertEqual(from_neo_time(value), datetime(2024, 1, 1, 0, 30, 15, 123456))
+
+    def test_naive_unchanged(self):
+        """Test that a DateTime without timezone is kept as stored."""
+        native = datetime(2024, 1, 1, 9, 30, 15, 123456)
+        self.assertEqual(from_neo_time(DateTime.from_native(native)), native)
+
+    def test_setter(self):
+        """Test that the neo_time setter converts once and keeps the given DateTime."""
+        trace = SigraphTrace("trace", uuid4(), datetime(2020, 1, 1))
+        value = DateTime.from_native(datetime(2024, 1, 1, 0, 0, 0, 1, tzinfo=timezone.utc))
+        trace.neo_time = value
+        self.assertEqual(trace.start_time, datetime(2024, 1, 1, 0, 0, 0, 1))
+        self.assertIs(trace.neo_time, value)
+        trace.start_time = datetime(2025, 1, 1)
+        self.assertEqual(trace.neo_time, DateTime.from_native(datetime(2025, 1, 1)))
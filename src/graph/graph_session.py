@@ -44,12 +44,12 @@ class GraphSession:
         # gen primary keys dict for GraphClient
         ## from ArtifactType to "artifact"
         ## from Trace to ("unit_id", "trace_id")
-        ## from Rule to "rule_id"
+        ## from SigmaRule to "rule_id"
         primary_keys: dict[str, str | tuple[str, ...]] | None = {}
         for atype in ArtifactType:
             primary_keys[atype] = "artifact"
         primary_keys["Trace"] = ("unit_id", "trace_id")
-        primary_keys["Rule"] = "rule_id"
+        primary_keys["SigmaRule"] = "rule_id"
 
         try:
             self.__client = GraphClient(